@@ -4,13 +4,6 @@ import sys
 import subprocess
 from pathlib import Path
 
-# Add dock icon support - must happen before Tkinter is imported
-try:
-    from AppKit import NSApplication
-    app = NSApplication.sharedApplication()
-except:
-    pass
-
 # Import main script
 script_dir = Path(__file__).parent.absolute()
 sys.path.insert(0, str(script_dir))
@@ -38,7 +31,9 @@ sys.modules['macos_helper'] = MacOSHelper
 if __name__ == "__main__":
     try:
         import reminder
+    except ModuleNotFoundError:
+        # Run the script directly if it can't be imported as a module
+        import runpy
+        runpy.run_path(str(script_dir / "reminder.py"), run_name="__main__")
+    else:
         reminder.main()
-    except ImportError:
-        # Try to execute the script directly if import fails
-        exec(open('/Users/krishnadasyam/Documents/clock-in-out-remainder/reminder.py').read())
@@ -4,8 +4,21 @@
 import sys
 import os
 import subprocess
+import shutil
+import time
 from pathlib import Path
 
+def write_if_changed(path, content):
+    """Write content to path only if it differs from what is already there. Returns True if written."""
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
 def create_app_nib():
     """Create a basic .nib file for macOS app to properly handle Dock interaction."""
     script_dir = Path(__file__).parent.absolute()
@@ -42,13 +55,12 @@ def create_app_nib():
 </plist>
 '''
     
-    with open(info_plist_path, "w") as f:
-        f.write(info_plist_content)
-    
-    print(f"Created Info.plist at {info_plist_path}")
+    if write_if_changed(info_plist_path, info_plist_content):
+        print(f"Created Info.plist at {info_plist_path}")
     
     # Create a simple AppleScript to handle notifications
-    notification_helper_path = script_dir / "notification_helper.scpt"
+    notification_helper_path = script_dir / "notification_helper.applescript"
+    compiled_helper_path = script_dir / "notification_helper.scpt"
     notification_helper_content = '''
 on run argv
     set titleText to item 1 of argv
@@ -58,20 +70,20 @@ on run argv
 end run
 '''
     
-    with open(notification_helper_path, "w") as f:
-        f.write(notification_helper_content)
+    write_if_changed(notification_helper_path, notification_helper_content)
         
-    # Compile AppleScript
-    try:
-        subprocess.run(["osacompile", "-o", str(script_dir / "notification_helper.scpt"), 
-                      str(notification_helper_path)])
-        print("Created notification helper script")
-    except:
-        print("Warning: Could not compile AppleScript helper")
+    # Compile AppleScript in the background when the source is newer; the caller waits for it
+    compile_proc = None
+    if (not compiled_helper_path.exists() or
+            compiled_helper_path.stat().st_mtime < notification_helper_path.stat().st_mtime):
+        try:
+            compile_proc = subprocess.Popen(["osacompile", "-o", str(compiled_helper_path), 
+                                            str(notification_helper_path)])
+        except OSError:
+            print("Warning: Could not compile AppleScript helper")
     
     # Create a wrapper script for launching the app with proper macOS support
     wrapper_script_path = script_dir / "clock_reminder_mac.py"
-    main_script_path = script_dir / "reminder.py"
     
     wrapper_content = f'''#!/usr/bin/env python3
 import os
@@ -79,13 +91,6 @@ import sys
 import subprocess
 from pathlib import Path
 
-# Add dock icon support - must happen before Tkinter is imported
-try:
-    from AppKit import NSApplication
-    app = NSApplication.sharedApplication()
-except:
-    pass
-
 # Import main script
 script_dir = Path(__file__).parent.absolute()
 sys.path.insert(0, str(script_dir))
@@ -113,51 +118,71 @@ sys.modules['macos_helper'] = MacOSHelper
 if __name__ == "__main__":
     try:
         import reminder
+    except ModuleNotFoundError:
+        # Run the script directly if it can't be imported as a module
+        import runpy
+        runpy.run_path(str(script_dir / "reminder.py"), run_name="__main__")
+    else:
         reminder.main()
-    except ImportError:
-        # Try to execute the script directly if import fails
-        exec(open('{main_script_path}').read())
 '''
     
-    with open(wrapper_script_path, "w") as f:
-        f.write(wrapper_content)
-    
-    # Make it executable
-    os.chmod(wrapper_script_path, 0o755)
-    
-    print(f"Created macOS wrapper script at {wrapper_script_path}")
-    return wrapper_script_path
+    if write_if_changed(wrapper_script_path, wrapper_content):
+        # Make it executable
+        os.chmod(wrapper_script_path, 0o755)
+        print(f"Created macOS wrapper script at {wrapper_script_path}")
+    return wrapper_script_path, compile_proc
+
+def wait_for_processes(jobs):
+    """Poll (description, process) pairs until all have exited and report each result."""
+    while jobs:
+        for job in list(jobs):
+            description, proc = job
+            returncode = proc.poll()
+            if returncode is None:
+                continue
+            jobs.remove(job)
+            if returncode == 0:
+                print(f"Created {description}")
+            else:
+                print(f"Warning: Could not create {description}")
+        if jobs:
+            time.sleep(0.1)
 
 def fix_macos_app_settings():
     """Apply macOS-specific fixes."""
     # Create .nib file and wrapper
-    wrapper_path = create_app_nib()
+    wrapper_path, compile_proc = create_app_nib()
+    jobs = []
+    if compile_proc is not None:
+        jobs.append(("notification helper script", compile_proc))
     
     # Create a simple launcher shell script
     script_dir = Path(__file__).parent.absolute()
     launcher_path = script_dir / "run_clock_reminder.command"
     
-    with open(launcher_path, "w") as f:
-        f.write(f'''#!/bin/bash
+    launcher_content = f'''#!/bin/bash
 cd "$(dirname "$0")"
 python3 "{wrapper_path}"
-''')
+'''
     
-    # Make it executable
-    os.chmod(launcher_path, 0o755)
+    if write_if_changed(launcher_path, launcher_content):
+        # Make it executable
+        os.chmod(launcher_path, 0o755)
+        print(f"Created macOS launcher at {launcher_path}")
     
-    print(f"Created macOS launcher at {launcher_path}")
     print("You can now run the application by double-clicking this file in Finder.")
     
     # Create a Dock-friendly launcher app if platypus is installed
     try:
-        if subprocess.run(["which", "platypus"], capture_output=True).returncode == 0:
-            app_path = script_dir / "Clock Reminder.app"
+        app_path = script_dir / "Clock Reminder.app"
+        if app_path.exists():
+            print(f"macOS app bundle already exists at {app_path}")
+        elif shutil.which("platypus"):
             icon_path = script_dir / "clock.icns"
             if not icon_path.exists():
                 icon_path = script_dir / "clock.png"
                 
-            subprocess.run([
+            platypus_proc = subprocess.Popen([
                 "platypus", 
                 "-a", "Clock Reminder",
                 "-o", "Text Window",
@@ -168,10 +193,12 @@ python3 "{wrapper_path}"
                 "-f", str(wrapper_path),
                 str(app_path)
             ])
-            
-            print(f"Created macOS app bundle at {app_path}")
+            jobs.append((f"macOS app bundle at {app_path}", platypus_proc))
     except:
         print("Note: Platypus not found. If you want to create a .app bundle, install Platypus with 'brew install platypus'")
+    
+    # Let osacompile and platypus run side by side and wait for both
+    wait_for_processes(jobs)
 
 if __name__ == "__main__":
     fix_macos_app_settings()
\ No newline at end of file
@@ -4,6 +4,7 @@
 
 import tkinter as tk
 from tkinter import messagebox, ttk
+import tkinter.font as tkfont
 import time
 import datetime
 import json
@@ -11,13 +12,43 @@ import os
 import sys
 import threading
 from pathlib import Path
-import platform
 import math
 import random
 import subprocess
+import functools
+import collections
+import base64
+import importlib
+import importlib.util
+import select
+
+# Prefer the C-accelerated orjson for settings/presets; both sides work on bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # Platform detection
-PLATFORM = platform.system().lower()  # 'windows', 'darwin' (macOS), or 'linux'
+PLATFORM = {'win32': 'windows', 'darwin': 'darwin', 'linux': 'linux'}.get(sys.platform, sys.platform)  # 'windows', 'darwin' (macOS), or 'linux'
+IS_WINDOWS = PLATFORM == 'windows'
+
+# Default font family based on platform
+FONT_FAMILY = {'windows': "Arial", 'darwin': "SF Pro"}.get(PLATFORM, "DejaVu Sans")
+
+# Platform-specific data directory for app files
+if IS_WINDOWS:
+    # Windows: Use %APPDATA%\ClockReminder
+    DATA_DIR = Path(os.environ.get('APPDATA', str(Path.home()))) / "ClockReminder"
+elif PLATFORM == 'darwin':
+    # macOS: Use ~/Library/Application Support/ClockReminder
+    DATA_DIR = Path.home() / "Library" / "Application Support" / "ClockReminder"
+else:
+    # Linux/Others: Use ~/.clockreminder
+    DATA_DIR = Path.home() / ".clockreminder"
 
 # ========================================================================================
 # DEPENDENCY CHECKING
@@ -26,36 +57,26 @@ def check_dependencies():
     """Check if required dependencies are installed and prompt for installation if needed"""
     missing_deps = []
     
-    # Try importing optional dependencies
-    try:
-        import pytz
-        print("pytz is installed")
-    except ImportError:
-        missing_deps.append("pytz")
-        print("pytz is not installed - timezone functionality will be limited")
-        
-    try:
-        from PIL import Image, ImageDraw
-        print("Pillow is installed")
-    except ImportError:
-        missing_deps.append("pillow")
-        print("Pillow is not installed - icon creation will be limited")
+    # (module name, pip package, feature that needs it)
+    optional_deps = [
+        ("pytz", "pytz", "timezone functionality"),
+        ("PIL", "pillow", "icon creation"),
+    ]
     
     # Platform-specific dependencies
-    if PLATFORM == 'windows':
-        try:
-            import pystray
-            print("pystray is installed")
-        except ImportError:
-            missing_deps.append("pystray")
-            print("pystray is not installed - system tray functionality will be limited")
-            
-        try:
-            from win10toast import ToastNotifier
-            print("win10toast is installed")
-        except ImportError:
-            missing_deps.append("win10toast")
-            print("win10toast is not installed - notification functionality will be limited")
+    if IS_WINDOWS:
+        optional_deps += [
+            ("pystray", "pystray", "system tray functionality"),
+            ("win10toast", "win10toast", "notification functionality"),
+        ]
+    
+    # Probe with find_spec so nothing is actually imported at startup
+    for module_name, package, feature in optional_deps:
+        if _have(module_name):
+            print(f"{package} is installed")
+        else:
+            missing_deps.append(package)
+            print(f"{package} is not installed - {feature} will be limited")
     
     # If there are missing dependencies, offer to install them
     if missing_deps and messagebox.askyesno(
@@ -70,100 +91,108 @@ def check_dependencies():
         except Exception as e:
             messagebox.showerror("Error", f"Failed to install dependencies: {str(e)}")
 
-# Delayed imports to handle missing dependencies gracefully
-try:
-    from PIL import Image, ImageDraw
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-
-try:
-    import pytz
-    PYTZ_AVAILABLE = True
-except ImportError:
-    PYTZ_AVAILABLE = False
+# Lazy imports - heavy optional dependencies are only loaded on first real use
+_LAZY = {
+    "Image": "PIL.Image",
+    "ImageDraw": "PIL.ImageDraw",
+    "pytz": "pytz",
+    "ToastNotifier": "win10toast:ToastNotifier",
+    "pystray": "pystray",
+    "winsound": "winsound",
+}
 
-# Platform-specific imports
-if PLATFORM == 'windows':
+@functools.lru_cache(maxsize=None)
+def _have(module_name):
+    """Check whether a module can be imported without actually importing it"""
     try:
-        from win10toast import ToastNotifier
-        TOAST_AVAILABLE = True
-    except ImportError:
-        TOAST_AVAILABLE = False
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
 
-    try:
-        import winsound
-        WINSOUND_AVAILABLE = True
-    except ImportError:
-        WINSOUND_AVAILABLE = False
-        
-    try:
-        import pystray
-        TRAY_SUPPORT = True
-    except ImportError:
-        TRAY_SUPPORT = False
-elif PLATFORM == 'darwin':
-    # For macOS, we'll use native osascript for notifications
-    TOAST_AVAILABLE = False
-    WINSOUND_AVAILABLE = False
-    TRAY_SUPPORT = False
-else:
-    # For Linux, try to use notify-send for notifications
-    TOAST_AVAILABLE = False
-    WINSOUND_AVAILABLE = False
-    try:
-        import pystray
-        TRAY_SUPPORT = True
-    except ImportError:
-        TRAY_SUPPORT = False
+def _lazy_import(name):
+    """Import a name from _LAZY on demand and cache it in the module globals"""
+    module_name, _, attr = _LAZY[name].partition(":")
+    obj = importlib.import_module(module_name)
+    if attr:
+        obj = getattr(obj, attr)
+    globals()[name] = obj
+    return obj
+
+def __getattr__(name):
+    if name in _LAZY:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ========================================================================================
 # ICON CREATION
 # ========================================================================================
+# Pre-rendered 64x64 PNG of the default clock icon (same drawing as _draw_app_icon)
+_DEFAULT_ICON_PNG = (
+    b"iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABoUlEQVR42u2bMQ7CMAxFG4sL"
+    b"sTIj0b3nZAeJmZUjwVSpqkhrO45jp7bEgITa/Nf/09C4wxAVFRV14EqaJzvfLl/sbz/Pd+oC"
+    b"AEV0CxhJU/Tr/kAf4zqNKjBSbeEU0RQYUiBSDfESojEwJCAkL8JrgQCP4tfnK5lowaN4SQip"
+    b"RHwr4VuRoMYBehC/HA/VCdCD+BIIwMm8h8KOF7iUpXI7f2pMjGIArFu/JArQm3gqBBgOXtDj"
+    b"1ae4IBwQADq1PzYG4YAA0LH9MTEIBwSAxg8wct+7BpAT2wJCRCAANLwtHdoBOQja88DJwgJl"
+    b"Lf46jWouMTUHLEVrOeEvgHlzocVtqQaErU0Tk3cBTSeYvQ1qQcgCaBkDSQh7e4bmF0K1neBi"
+    b"JVgTwiYACzEogYDZMnf1X2CGILlIQjUTeHxEhm2YQDnAUhQkxbMiYB0CdXxoAFq9u1KFHS9w"
+    b"DmrVBZxGKeCStQaB2yXGtrWFPsH1heDEFCQy1soNEu2yIDXRaEOQ6hWObnHJwR36fYE9EFQY"
+    b"Lt8YocCosagxCYALw9vKMyoqymf9AMclCZLx6IEDAAAAAElFTkSuQmCC"
+)
+
+def _draw_app_icon():
+    """Draw the default clock icon with Pillow and return the image"""
+    Image = _lazy_import("Image")
+    ImageDraw = _lazy_import("ImageDraw")
+    
+    # Create a simple clock icon
+    width, height = 64, 64
+    image = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # Draw a circle for the clock face (light gray)
+    draw.ellipse((5, 5, width-5, height-5), fill=(237, 244, 242, 255), outline=(49, 71, 58, 255), width=2)
+    
+    # Draw clock hands
+    center_x, center_y = width // 2, height // 2
+    
+    # Hour hand (shorter)
+    hour_hand_length = 15
+    draw.line(
+        (center_x, center_y, center_x, center_y - hour_hand_length), 
+        fill=(49, 71, 58, 255), 
+        width=3
+    )
+    
+    # Minute hand (longer)
+    minute_hand_length = 25
+    draw.line(
+        (center_x, center_y, center_x + minute_hand_length // 2, center_y + minute_hand_length // 2), 
+        fill=(49, 71, 58, 255), 
+        width=2
+    )
+    
+    # Draw center dot
+    draw.ellipse((center_x-3, center_y-3, center_x+3, center_y+3), fill=(49, 71, 58, 255))
+    
+    return image
+
 def create_app_icon(save_path):
     """Create a default app icon and save it to the specified path"""
-    if not PIL_AVAILABLE:
-        print("Cannot create icon: PIL not available")
-        return None
+    # Windows needs an .ico, which only Pillow can produce; everything else gets the PNG
+    if IS_WINDOWS and _have("PIL"):
+        icon_path = Path(save_path) / "clock.ico"
+    else:
+        icon_path = Path(save_path) / "clock.png"
+    
+    # Reuse the icon written by a previous run
+    if icon_path.exists() and icon_path.stat().st_size > 0:
+        return str(icon_path)
         
     try:
-        # Create a simple clock icon
-        width, height = 64, 64
-        image = Image.new('RGBA', (width, height), color=(0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Draw a circle for the clock face (light gray)
-        draw.ellipse((5, 5, width-5, height-5), fill=(237, 244, 242, 255), outline=(49, 71, 58, 255), width=2)
-        
-        # Draw clock hands
-        center_x, center_y = width // 2, height // 2
-        
-        # Hour hand (shorter)
-        hour_hand_length = 15
-        draw.line(
-            (center_x, center_y, center_x, center_y - hour_hand_length), 
-            fill=(49, 71, 58, 255), 
-            width=3
-        )
-        
-        # Minute hand (longer)
-        minute_hand_length = 25
-        draw.line(
-            (center_x, center_y, center_x + minute_hand_length // 2, center_y + minute_hand_length // 2), 
-            fill=(49, 71, 58, 255), 
-            width=2
-        )
-        
-        # Draw center dot
-        draw.ellipse((center_x-3, center_y-3, center_x+3, center_y+3), fill=(49, 71, 58, 255))
-        
-        # Save in the appropriate format based on platform
-        if PLATFORM == 'windows':
-            icon_path = Path(save_path) / "clock.ico"
-            image.save(icon_path, format="ICO")
+        if icon_path.suffix == '.ico':
+            _draw_app_icon().save(icon_path, format="ICO")
         else:
-            icon_path = Path(save_path) / "clock.png"
-            image.save(icon_path, format="PNG")
+            icon_path.write_bytes(base64.b64decode(_DEFAULT_ICON_PNG))
             
         print(f"Created application icon at {icon_path}")
         return str(icon_path)
@@ -174,60 +203,210 @@ def create_app_icon(save_path):
 # ========================================================================================
 # NOTIFICATION SYSTEM
 # ========================================================================================
+# Shared win10toast notifier, created on the first Windows notification
+_toaster = None
+
+# Long-lived interactive osascript process used for macOS notifications
+_osascript_proc = None
+
+# Logged after every statement; AppleScript errors show up on stderr before it
+_OSA_DONE = "__clock_reminder_done__"
+
+def _run_osascript(script):
+    """Run one AppleScript statement on the persistent osascript host, raising if it failed"""
+    global _osascript_proc
+    for _ in range(2):
+        if _osascript_proc is None or _osascript_proc.poll() is not None:
+            _osascript_proc = subprocess.Popen(
+                ['osascript', '-i'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+        try:
+            _osascript_proc.stdin.write(f'{script}\nlog "{_OSA_DONE}"\n')
+            _osascript_proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            _osascript_proc = None
+            continue
+        _read_osascript_result(_osascript_proc)
+        return
+    raise RuntimeError("osascript host is not accepting input")
+
+def _read_osascript_result(proc, timeout=2.0):
+    """Drain the host's stderr up to the sentinel without blocking past the timeout"""
+    global _osascript_proc
+    fd = proc.stderr.fileno()
+    deadline = time.monotonic() + timeout
+    output = b""
+    done = _OSA_DONE.encode()
+    while done not in output:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            break
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            break
+        output += chunk
+    else:
+        errors = output.split(done)[0].decode(errors="replace").strip()
+        if "error" in errors.lower():
+            raise RuntimeError(errors)
+        return
+    # The host hung or exited; start a fresh one next time
+    proc.kill()
+    _osascript_proc = None
+    raise RuntimeError("osascript host did not respond")
+
+# Session bus connection used for Linux notifications, opened on first use
+_dbus_conn = None
+
+def _notify_dbus(title, message):
+    """Send a notification to org.freedesktop.Notifications without spawning a process"""
+    global _dbus_conn
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
+    
+    if _dbus_conn is None:
+        _dbus_conn = open_dbus_connection(bus='SESSION')
+        
+    notifications = DBusAddress(
+        '/org/freedesktop/Notifications',
+        bus_name='org.freedesktop.Notifications',
+        interface='org.freedesktop.Notifications'
+    )
+    msg = new_method_call(
+        notifications, 'Notify', 'susssasa{sv}i',
+        ('Clock Reminder', 0, '', title, message, [], {}, 5000)
+    )
+    try:
+        reply = _dbus_conn.send_and_get_reply(msg, timeout=2)
+    except Exception:
+        # Drop the connection so the next notification reconnects
+        _dbus_conn = None
+        raise
+    # Error replies (e.g. no notification daemon running) arrive as ordinary messages;
+    # unwrap_msg raises DBusErrorResponse for them so the caller falls back
+    unwrap_msg(reply)
+
+# Notifications waiting to be coalesced and sent on the next flush
+_pending = collections.deque()
+_flush_scheduled = False
+
 def show_notification(title, message, root=None, icon_path=None):
-    """Show a notification using the best available method for the platform"""
-    notification_shown = False
+    """Queue a notification; notifications raised close together are sent as one per title.
     
-    # Windows notifications
-    if PLATFORM == 'windows':
-        # Method 1: Try win10toast
-        if TOAST_AVAILABLE:
-            try:
-                toaster = ToastNotifier()
-                toaster.show_toast(
-                    title, 
-                    message, 
-                    icon_path=icon_path if icon_path and os.path.exists(icon_path) else None,
-                    duration=5,
-                    threaded=True
-                )
-                notification_shown = True
-                print(f"Notification via win10toast: {title} - {message}")
-            except Exception as e:
-                print(f"Error with win10toast notification: {e}")
-        
-        # Method 2: Use winsound for audio alert
-        if WINSOUND_AVAILABLE and not notification_shown:
-            try:
-                winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
-                print(f"\n[NOTIFICATION] {title}: {message}\n")
-                notification_shown = True
-            except Exception as e:
-                print(f"Error playing notification sound: {e}")
+    Without a root window the notification is sent right away and the result returned;
+    queued notifications return None and report failures from _flush_pending.
+    """
+    global _flush_scheduled
+    
+    # Without an event loop there is nothing to batch on, send right away
+    if root is None:
+        return _send_notification(title, message, root, icon_path)
     
-    # macOS notifications
-    elif PLATFORM == 'darwin':
+    _pending.append((title, message, root, icon_path))
+    if not _flush_scheduled:
+        _flush_scheduled = True
+        root.after(50, _flush_pending)
+
+def _flush_pending():
+    """Send all queued notifications, merging messages that share a title, window and icon"""
+    global _flush_scheduled
+    _flush_scheduled = False
+    
+    grouped = {}
+    while _pending:
+        title, message, root, icon_path = _pending.popleft()
+        grouped.setdefault((title, root, icon_path), []).append(message)
+    
+    for (title, root, icon_path), messages in grouped.items():
+        if not _send_notification(title, "\n".join(messages), root, icon_path):
+            print(f"Failed to show notification: {title}")
+
+def _notify_windows(title, message, icon_path=None):
+    """Show a notification with win10toast, falling back to a system sound"""
+    global _toaster
+    
+    # Method 1: Try win10toast
+    if _have("win10toast"):
         try:
-            # Use osascript to show a notification
-            script = f'display notification "{message}" with title "{title}"'
-            subprocess.run(['osascript', '-e', script], check=True)
-            notification_shown = True
-            print(f"Notification via osascript: {title} - {message}")
+            if _toaster is None:
+                _toaster = _lazy_import("ToastNotifier")()
+            _toaster.show_toast(
+                title, 
+                message, 
+                icon_path=icon_path if icon_path and os.path.exists(icon_path) else None,
+                duration=5,
+                threaded=True
+            )
+            print(f"Notification via win10toast: {title} - {message}")
+            return True
         except Exception as e:
-            print(f"Error with macOS notification: {e}")
+            print(f"Error with win10toast notification: {e}")
     
-    # Linux notifications
-    elif PLATFORM == 'linux':
+    # Method 2: Use winsound for audio alert
+    if _have("winsound"):
+        try:
+            winsound = _lazy_import("winsound")
+            winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
+            print(f"\n[NOTIFICATION] {title}: {message}\n")
+            return True
+        except Exception as e:
+            print(f"Error playing notification sound: {e}")
+    return False
+
+# AppleScript notification statement and the escaping applied to its string literals
+_OSA_TPL = 'display notification "{m}" with title "{t}"'
+_OSA_ESC = str.maketrans({'"': '\\"', '\\': '\\\\', '\n': ' '})
+
+def _notify_darwin(title, message, icon_path=None):
+    """Show a notification through the persistent osascript host"""
+    try:
+        script = _OSA_TPL.format(m=message.translate(_OSA_ESC), t=title.translate(_OSA_ESC))
+        _run_osascript(script)
+        return True
+    except Exception as e:
+        print(f"Error with macOS notification: {e}")
+        return False
+
+def _notify_linux(title, message, icon_path=None):
+    """Show a notification over D-Bus, falling back to notify-send"""
+    # Method 1: Talk to the notification service over D-Bus directly
+    if _have("jeepney"):
         try:
-            # Try using notify-send command
-            subprocess.call(['notify-send', title, message])
-            notification_shown = True
-            print(f"Notification via notify-send: {title} - {message}")
+            _notify_dbus(title, message)
+            print(f"Notification via D-Bus: {title} - {message}")
+            return True
         except Exception as e:
-            print(f"Error with Linux notification: {e}")
+            print(f"Error with D-Bus notification: {e}")
     
+    # Method 2: Fall back to the notify-send command
+    try:
+        subprocess.call(['notify-send', title, message])
+        print(f"Notification via notify-send: {title} - {message}")
+        return True
+    except Exception as e:
+        print(f"Error with Linux notification: {e}")
+        return False
+
+def _notify_unsupported(title, message, icon_path=None):
+    """No native notifications on this platform"""
+    return False
+
+# Pick the platform notifier once at import instead of on every notification
+_NOTIFY_IMPL = {
+    'windows': _notify_windows,
+    'darwin': _notify_darwin,
+    'linux': _notify_linux,
+}.get(PLATFORM, _notify_unsupported)
+
+def _fallback_notification(title, message, root=None):
+    """Show a notification with Tk, or print it when there is no window"""
     # Custom notification window as fallback if we have a root window
-    if not notification_shown and root is not None:
+    if root is not None:
         try:
             notif_win = tk.Toplevel(root)
             notif_win.title(title)
@@ -241,30 +420,68 @@ def show_notification(title, message, root=None, icon_path=None):
             
             # Auto-close after 5 seconds
             notif_win.after(5000, notif_win.destroy)
-            notification_shown = True
             print(f"Custom notification window shown: {title} - {message}")
+            return True
         except Exception as e:
             print(f"Error with custom notification window: {e}")
-
     
-    # Last resort - use messagebox if available
-    if not notification_shown and root is not None:
+        # Last resort - use messagebox if available
         try:
             messagebox.showinfo(title, message)
-            notification_shown = True
             print(f"Notification via messagebox: {title} - {message}")
+            return True
         except Exception as e:
             print(f"Error with messagebox notification: {e}")
     
     # If all else fails, just print to console
-    if not notification_shown:
-        print(f"\n{'=' * 50}")
-        print(f"NOTIFICATION: {title}")
-        print(f"{message}")
-        print(f"{'=' * 50}\n")
-        notification_shown = True
-    
-    return notification_shown
+    print(f"\n{'=' * 50}")
+    print(f"NOTIFICATION: {title}")
+    print(f"{message}")
+    print(f"{'=' * 50}\n")
+    return True
+
+def _send_notification(title, message, root=None, icon_path=None):
+    """Show a notification using the best available method for the platform"""
+    return _NOTIFY_IMPL(title, message, icon_path) or _fallback_notification(title, message, root)
+
+# ========================================================================================
+# TIME PARSING
+# ========================================================================================
+@functools.lru_cache(maxsize=8)
+def parse_hhmm(text, ampm=None):
+    """Parse "HH:MM" (or "hh:MM" plus AM/PM) into a datetime.time, caching repeated strings"""
+    if ampm is None:
+        return datetime.datetime.strptime(text, "%H:%M").time()
+    return datetime.datetime.strptime(text + " " + ampm, "%I:%M %p").time()
+
+# ========================================================================================
+# DINOSAUR SPRITE
+# ========================================================================================
+# Dinosaur pixels (8x8 grid)
+_DINO_BODY = (
+    (1, 3), (1, 4), (1, 5),
+    (2, 2), (2, 3), (2, 4), (2, 5), (2, 6),
+    (3, 1), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7),
+    (4, 1), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6),
+    (5, 2), (5, 3), (5, 4), (5, 5),
+)
+_DINO_EYE = (3, 2)
+
+# Alternate legs for walking animation
+_DINO_LEGS = (
+    ((2, 7), (4, 7)),
+    ((3, 7), (5, 7)),
+)
+
+@functools.lru_cache(maxsize=None)
+def _build_dino_bitmap(leg_phase):
+    """Return the 8x8 sprite grid for a walking frame (0 = empty, 1 = body, 2 = eye)"""
+    grid = [[0] * 8 for _ in range(8)]
+    for px, py in _DINO_BODY + _DINO_LEGS[leg_phase]:
+        grid[py][px] = 1
+    px, py = _DINO_EYE
+    grid[py][px] = 2
+    return tuple(tuple(row) for row in grid)
 
 # ========================================================================================
 # MAIN APPLICATION
@@ -281,8 +498,9 @@ class ClockReminderApp:
         self.data_dir = self.get_data_dir()
         os.makedirs(self.data_dir, exist_ok=True)
         
-        # Set app icon
-        self.set_app_icon()
+        # App icon is set once the window is up and settings are loaded (see _post_init)
+        self.icon_path = None
+        self._cached_icon_path = None
         
         # Define colors - Dark green & light gray theme
         self.colors = {
@@ -294,7 +512,15 @@ class ClockReminderApp:
             "warning": "#FFC107"     # Warning color
         }
         
-        self.root.configure(bg=self.colors["background"])
+        # Plain attributes for the hot paths (self.color_primary, self.color_background, ...)
+        for name, value in self.colors.items():
+            setattr(self, f"color_{name}", value)
+        
+        self.root.configure(bg=self.color_background)
+        
+        # Card header strip, shared by every card (keep the reference or Tk drops the image)
+        self._header_img = tk.PhotoImage(width=1, height=8)
+        self._header_img.put(self.color_primary, to=(0, 0, 1, 8))
         
         # Configure platform-specific fonts
         self.set_platform_fonts()
@@ -304,12 +530,22 @@ class ClockReminderApp:
         self.clock_out_time = tk.StringVar(value="17:00")
         self.reminder_count = 0
         self.is_running = False
-        self.reminder_thread = None
+        self._reminder_after_id = None
+        self._reminder_event = None
+        self._reminder_due = None
+        self._save_after_id = None
+        self._last_saved = None
+        self._presets_cache = None
+        self._presets_mtime = 0
         self.time_format = tk.StringVar(value="24-hour")
         self.timezone = tk.StringVar(value="Local")
         self.animation_active = False
         self.dino_position = 0
         self.dino_direction = 1  # 1 for right, -1 for left
+        # Pre-generated (x, y, size) positions for the flying bits, cycled each frame
+        self._bits_pool = [(random.randint(10, 90), random.randint(10, 50), random.randint(1, 2))
+                           for _ in range(64)]
+        self._bits_idx = 0
         self.next_event_text = tk.StringVar(value="")
         
         # Animation variables for countdown
@@ -318,52 +554,94 @@ class ClockReminderApp:
         self.countdown_minutes = 0
         self.countdown_seconds = 0
         
-        # Load saved data
-        self.load_data()
+        # Widget updates waiting for the next idle flush
+        self._pending_ui = {}
+        self._ui_flush_scheduled = False
         
-        # Create UI components
-        self.create_scrollable_area()
-        self.create_widgets()
+        # Last rendered values, so the UI tick only touches widgets that changed
+        self._last_time_str = None
+        self._last_next_event_text = None
+        self._last_hms = None
+        self._last_progress_px = -1
+        self._last_count_shown = None
         
-        # Start animations
-        self.start_animations()
+        # Parsed clock in/out times, refreshed lazily after edits (see _event_times)
+        self._times_dirty = True
+        self._clock_in_time_obj = None
+        self._clock_out_time_obj = None
+        # ((day, clock in, clock out), today's in/out, yesterday's out, tomorrow's in)
+        self._day_events = (None, None, None, None, None)
         
-        # Update time remaining display
-        self.update_time_remaining()
-
+        # (event type, monotonic deadline, interval length) for the running countdown
+        self._countdown = None
+        self._countdown_resync = 0
+        
+        # (epoch second, "%H:%M:%S", "%I:%M:%S %p") for the last formatted second
+        self._time_cache = (0, "", "")
         
+        # Create UI components
         self.create_scrollable_area()
-        self.scroll_canvas.bind("<Enter>", lambda e: self.scroll_canvas.focus_set())
-        self.scroll_canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.create_widgets()
+        self.scroll_canvas.bind("<Enter>", lambda e: self.scroll_canvas.focus_set(), add="+")
 
+        # Keep the scheduled reminder in sync with the clock in/out settings
+        for var in (self.clock_in_time, self.clock_out_time, self.time_format):
+            var.trace_add("write", self._on_times_changed)
+        self.clock_in_ampm.bind("<<ComboboxSelected>>", self._on_times_changed, add="+")
+        self.clock_out_ampm.bind("<<ComboboxSelected>>", self._on_times_changed, add="+")
+        self.clock_in_ampm.bind("<KeyRelease>", self._on_times_changed, add="+")
+        self.clock_out_ampm.bind("<KeyRelease>", self._on_times_changed, add="+")
+        
+        # Persist setting changes (debounced)
+        for var in (self.clock_in_time, self.clock_out_time, self.time_format, self.timezone):
+            var.trace_add("write", self.schedule_save)
 
-        # Start reminder thread if app was previously running
-        if self.is_running:
-            self.start_reminders()
+        # Prime strptime's format cache so the first time edit doesn't pay the regex compile
+        datetime.datetime.strptime("12:00 AM", "%I:%M %p")
+        datetime.datetime.strptime("00:00", "%H:%M")
+        
+        # Load saved data and start animations once the window is up
+        self.root.after_idle(self._post_init)
             
         # Set up close handler
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
-    def _on_mousewheel(self, event):
-        # event.delta is typically 120 or -120 per notch on Windows
-        self.scroll_canvas.yview_scroll(int(-event.delta/120), "units")
-        return "break"
-
-
+        
+        # Pause the animation and clock redraws while the window is minimized
+        self._visible = True
+        self.root.bind("<Map>", self._on_map_change, add="+")
+        self.root.bind("<Unmap>", self._on_map_change, add="+")
+    
+    def _on_map_change(self, event):
+        """Track whether the main window is shown, so hidden frames skip their redraws."""
+        if event.widget is self.root:
+            self._visible = event.type == tk.EventType.Map
+    
+    def _post_init(self):
+        """Load saved settings into the already visible UI and start the animations."""
+        self.load_data()
+        self.set_app_icon()
+        self.update_time_format()
+        self.update_counter()
+        
+        # Schedule reminders if app was previously running
+        if self.is_running:
+            self._set_status("Stop Reminders", "Reminders are active")
+            self.start_reminders()
+        
+        # Start animations (also keeps the clock and countdown up to date)
+        self.start_animations()
     
     def get_data_dir(self):
         """Get platform-specific data directory for app files"""
-        if PLATFORM == 'windows':
-            # Windows: Use %APPDATA%\ClockReminder
-            return Path(os.environ.get('APPDATA', str(Path.home()))) / "ClockReminder"
-        elif PLATFORM == 'darwin':
-            # macOS: Use ~/Library/Application Support/ClockReminder
-            return Path.home() / "Library" / "Application Support" / "ClockReminder"
-        else:
-            # Linux/Others: Use ~/.clockreminder
-            return Path.home() / ".clockreminder"
+        return DATA_DIR
     
     def set_app_icon(self):
         """Set application icon or create a default one if none exists"""
+        # Warm start: the icon resolved on a previous run is remembered in settings.json
+        cached = self._cached_icon_path
+        if cached and os.path.exists(cached) and self._apply_icon(cached):
+            return
+        
         # Check for existing icon files
         icon_paths = [
             self.app_dir / "clock.ico",
@@ -373,159 +651,151 @@ class ClockReminderApp:
         
         icon_found = False
         for icon_path in icon_paths:
-            if icon_path.exists():
-                try:
-                    if PLATFORM == 'windows' and icon_path.suffix == '.ico':
-                        self.root.iconbitmap(str(icon_path))
-                        self.icon_path = str(icon_path)
-                        icon_found = True
-                        break
-                    elif hasattr(self.root, 'iconphoto'):
-                        icon_img = tk.PhotoImage(file=str(icon_path))
-                        self.root.iconphoto(True, icon_img)
-                        self.icon_path = str(icon_path)
-                        icon_found = True
-                        break
-                except Exception as e:
-                    print(f"Error setting icon {icon_path}: {e}")
+            if icon_path.exists() and self._apply_icon(str(icon_path)):
+                icon_found = True
+                break
         
         # Create default icon if none found
         if not icon_found:
             icon_path = create_app_icon(self.app_dir)
             if icon_path:
+                self._apply_icon(icon_path)
                 self.icon_path = icon_path
-                try:
-                    if PLATFORM == 'windows' and icon_path.endswith('.ico'):
-                        self.root.iconbitmap(icon_path)
-                    elif hasattr(self.root, 'iconphoto') and Path(icon_path).exists():
-                        icon_img = tk.PhotoImage(file=icon_path)
-                        self.root.iconphoto(True, icon_img)
-                except Exception as e:
-                    print(f"Error setting created icon: {e}")
             else:
                 self.icon_path = None
+        
+        # Remember the winner so the next launch skips the probe
+        if self.icon_path != self._cached_icon_path:
+            self._cached_icon_path = self.icon_path
+            self.schedule_save()
+    
+    def _apply_icon(self, icon_path):
+        """Set the window icon from a file; return True on success"""
+        try:
+            if IS_WINDOWS and icon_path.endswith('.ico'):
+                self.root.iconbitmap(icon_path)
+            elif hasattr(self.root, 'iconphoto') and not icon_path.endswith('.ico'):
+                icon_img = tk.PhotoImage(file=icon_path)
+                self.root.iconphoto(True, icon_img)
+            else:
+                return False
+        except Exception as e:
+            print(f"Error setting icon {icon_path}: {e}")
+            return False
+        self.icon_path = icon_path
+        return True
     
     def set_platform_fonts(self):
         """Configure platform-specific fonts"""
-        # Default font family based on platform
-        if PLATFORM == 'windows':
-            self.font_family = "Arial"
-        elif PLATFORM == 'darwin':
-            self.font_family = "SF Pro"  # macOS default font
-        else:
-            self.font_family = "DejaVu Sans"  # Common Linux font
+        self.font_family = FONT_FAMILY
+        
+        # Named fonts, created once and shared by all widgets
+        self.F_HEADING = tkfont.Font(family=self.font_family, size=18, weight="bold")
+        self.F_TITLE = tkfont.Font(family=self.font_family, size=12, weight="bold")
+        self.F_TIME = tkfont.Font(family=self.font_family, size=16, weight="bold")
+        self.F_BIG = tkfont.Font(family=self.font_family, size=28, weight="bold")
+        self.F_EVENT = tkfont.Font(family=self.font_family, size=11, weight="bold")
+        self.F_BOLD = tkfont.Font(family=self.font_family, size=10, weight="bold")
+        self.F_NORMAL = tkfont.Font(family=self.font_family, size=10)
+        self.F_ITALIC = tkfont.Font(family=self.font_family, size=10, slant="italic")
+        self.F_SMALL = tkfont.Font(family=self.font_family, size=9)
+        self.F_HINT = tkfont.Font(family=self.font_family, size=9, slant="italic")
             
         # Configure ttk styles for better appearance
         self.style = ttk.Style()
-        self.style.configure("TButton", font=(self.font_family, 10, "bold"))
-        self.style.configure("TCombobox", font=(self.font_family, 10))
+        self.style.configure("TButton", font=self.F_BOLD)
+        self.style.configure("TCombobox", font=self.F_NORMAL)
+        self.style.configure("Card.TFrame", background="white", relief="ridge", borderwidth=1)
+        self.style.configure("Countdown.Horizontal.TProgressbar", background=self.color_primary,
+                             troughcolor="#E0E0E0", borderwidth=0, thickness=20)
     
     def create_background(self):
         """Create a background canvas for the application"""
         self.canvas = tk.Canvas(self.root, width=500, height=600, 
-                               bg=self.colors["background"], highlightthickness=0)
+                               bg=self.color_background, highlightthickness=0)
         self.canvas.place(x=0, y=0, relwidth=1, relheight=1)
         
         # Create a frame on top of the canvas for widgets
-        self.main_frame = tk.Frame(self.root, bg=self.colors["background"], highlightthickness=0)
+        self.main_frame = tk.Frame(self.root, bg=self.color_background, highlightthickness=0)
         self.main_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER, relwidth=0.95, relheight=0.95)
     
-    def draw_dinosaur(self):
-        """Draw a pixelated dinosaur"""
-        # Clear canvas
-        self.dino_canvas.delete("all")
-        
+    def create_dino_sprites(self):
+        """Pre-render the two walking frames of the pixelated dinosaur"""
         # Pixel size
         pixel_size = 4
+        # Empty cells use the canvas background so the whole frame is written in one put()
+        colors = (self.color_background, self.color_primary, 'white')
+        
+        self.dino_frames = []
+        for leg_phase in range(len(_DINO_LEGS)):
+            rows = []
+            for grid_row in _build_dino_bitmap(leg_phase):
+                row = " ".join(colors[code] for code in grid_row for _ in range(pixel_size))
+                rows.extend(["{" + row + "}"] * pixel_size)
+            frame = tk.PhotoImage(width=8 * pixel_size, height=8 * pixel_size)
+            frame.put(" ".join(rows), to=(0, 0))
+            self.dino_frames.append(frame)
+    
+    def draw_dinosaur(self):
+        """Move the dinosaur sprite and show the current walking frame"""
+        frame = self.dino_frames[0] if self.dino_position % 8 < 4 else self.dino_frames[1]
+        self.dino_canvas.coords(self.dino_item, self.dino_position * 4, 0)
+        self.dino_canvas.itemconfig(self.dino_item, image=frame)
+        
+        # Move the small pixels representing flying bits
+        for bit in self.dino_bits:
+            px, py, size = self._bits_pool[self._bits_idx]
+            self._bits_idx = (self._bits_idx + 1) % len(self._bits_pool)
+            self.dino_canvas.coords(bit, px, py, px + size, py + size)
+    
+    def _make_card(self, title, pady=10):
+        """Create a titled white card in the main frame and return its content frame"""
+        card = ttk.Frame(self.main_frame, style="Card.TFrame")
+        card.pack(fill="x", padx=10, pady=pady)
         
-        # Dinosaur position (8x8 grid)
-        x_pos = self.dino_position
-        
-        # Draw pixels for dinosaur
-        dino_pixels = [
-            # Body (darker green)
-            (1, 3), (1, 4), (1, 5),
-            (2, 2), (2, 3), (2, 4), (2, 5), (2, 6),
-            (3, 1), (3, 2), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7),
-            (4, 1), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6),
-            (5, 2), (5, 3), (5, 4), (5, 5),
-            # Eye (white)
-            (3, 2),
-        ]
+        # Add a subtle header
+        tk.Label(card, image=self._header_img, bg=self.color_primary,
+                 borderwidth=0, highlightthickness=0).pack(fill="x")
         
-        # Alternate legs for walking animation
-        leg_pixels = []
-        if self.dino_position % 8 < 4:
-            leg_pixels = [(2, 7), (4, 7)]
-        else:
-            leg_pixels = [(3, 7), (5, 7)]
-        
-        # Draw dinosaur body
-        for px, py in dino_pixels:
-            if (px, py) == (3, 2):  # Eye
-                self.dino_canvas.create_rectangle(
-                    (x_pos + px) * pixel_size, py * pixel_size,
-                    (x_pos + px + 1) * pixel_size, (py + 1) * pixel_size,
-                    fill='white', outline='')
-            else:
-                self.dino_canvas.create_rectangle(
-                    (x_pos + px) * pixel_size, py * pixel_size,
-                    (x_pos + px + 1) * pixel_size, (py + 1) * pixel_size,
-                    fill=self.colors["primary"], outline='')
-        
-        # Draw legs
-        for px, py in leg_pixels:
-            self.dino_canvas.create_rectangle(
-                (x_pos + px) * pixel_size, py * pixel_size,
-                (x_pos + px + 1) * pixel_size, (py + 1) * pixel_size,
-                fill=self.colors["primary"], outline='')
-        
-        # Draw some small pixels representing flying bits
-        for _ in range(3):
-            px = random.randint(10, 90)
-            py = random.randint(10, 50)
-            size = random.randint(1, 2)
-            self.dino_canvas.create_rectangle(
-                px, py, px + size, py + size,
-                fill=self.colors["text"], outline='')
+        tk.Label(card, text=title, font=self.F_TITLE, 
+                 bg='white', fg=self.color_primary).pack(anchor="w", padx=15, pady=(10, 5))
+        
+        # Inner padding frame
+        content = tk.Frame(card, bg='white', padx=15, pady=10)
+        content.pack(fill="x")
+        return content
     
     def create_widgets(self):
         # Dinosaur Animation canvas
         self.dino_canvas = tk.Canvas(self.main_frame, width=100, height=60, 
-                                    bg=self.colors["background"], highlightthickness=0)
+                                    bg=self.color_background, highlightthickness=0)
         self.dino_canvas.pack(pady=(10, 5))
         
+        # Create the dinosaur sprite and flying bits once; frames only move them
+        self.create_dino_sprites()
+        self.dino_item = self.dino_canvas.create_image(0, 0, anchor="nw", image=self.dino_frames[0])
+        self.dino_bits = [
+            self.dino_canvas.create_rectangle(0, 0, 0, 0, fill=self.color_text, outline='')
+            for _ in range(3)
+        ]
+        
         # Draw initial dinosaur
         self.draw_dinosaur()
         
         # Title
         title_label = tk.Label(self.main_frame, text="Clock In/Out Reminder", 
-                              font=(self.font_family, 18, "bold"), bg=self.colors["background"], 
-                              fg=self.colors["primary"])
+                              font=self.F_HEADING, bg=self.color_background, 
+                              fg=self.color_primary)
         title_label.pack(pady=(0, 15))
         
         # Create card-like container for settings
-        settings_frame = tk.Frame(self.main_frame, bg='white', 
-                                 relief=tk.RIDGE, bd=1)
-        settings_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add a subtle header
-        settings_header = tk.Frame(settings_frame, bg=self.colors["primary"], height=8)
-        settings_header.pack(fill="x")
-        
-        settings_title = tk.Label(settings_frame, text="Settings", font=(self.font_family, 12, "bold"), 
-                                 bg='white', fg=self.colors["primary"])
-        settings_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner padding frame
-        settings_content = tk.Frame(settings_frame, bg='white', padx=15, pady=10)
-        settings_content.pack(fill="x")
+        settings_content = self._make_card("Settings", pady=5)
         
         # Time Format Settings
         format_frame = tk.Frame(settings_content, bg='white')
         format_frame.pack(fill="x", pady=5)
         
-        tk.Label(format_frame, text="Time Format:", font=(self.font_family, 10, "bold"), 
+        tk.Label(format_frame, text="Time Format:", font=self.F_BOLD, 
                 bg='white').pack(side=tk.LEFT, padx=5)
         
         format_options = ttk.Combobox(format_frame, textvariable=self.time_format, width=10)
@@ -537,13 +807,13 @@ class ClockReminderApp:
         timezone_frame = tk.Frame(settings_content, bg='white')
         timezone_frame.pack(fill="x", pady=5)
         
-        tk.Label(timezone_frame, text="Time Zone:", font=(self.font_family, 10, "bold"), 
+        tk.Label(timezone_frame, text="Time Zone:", font=self.F_BOLD, 
                 bg='white').pack(side=tk.LEFT, padx=5)
         
         timezone_options = ttk.Combobox(timezone_frame, textvariable=self.timezone, width=25)
         
         # Only show timezone options if pytz is available
-        if PYTZ_AVAILABLE:
+        if _have("pytz"):
             popular_timezones = ['Local', 'US/Eastern', 'US/Central', 'US/Mountain', 'US/Pacific', 
                                'Europe/London', 'Europe/Paris', 'Asia/Tokyo', 'Australia/Sydney']
             timezone_options['values'] = popular_timezones
@@ -554,32 +824,18 @@ class ClockReminderApp:
         timezone_options.pack(side=tk.LEFT, padx=5)
         
         # Create card-like container for time inputs
-        times_frame = tk.Frame(self.main_frame, bg='white', 
-                              relief=tk.RIDGE, bd=1)
-        times_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Add a subtle header
-        times_header = tk.Frame(times_frame, bg=self.colors["primary"], height=8)
-        times_header.pack(fill="x")
-        
-        times_title = tk.Label(times_frame, text="Reminder Times", font=(self.font_family, 12, "bold"), 
-                              bg='white', fg=self.colors["primary"])
-        times_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner padding frame
-        times_content = tk.Frame(times_frame, bg='white', padx=15, pady=10)
-        times_content.pack(fill="x")
+        times_content = self._make_card("Reminder Times")
         
         # Clock In Frame
         clock_in_frame = tk.Frame(times_content, bg='white')
         clock_in_frame.pack(fill="x", pady=5)
         
-        clock_in_label = tk.Label(clock_in_frame, text="Clock In Time:", font=(self.font_family, 10, "bold"), 
+        clock_in_label = tk.Label(clock_in_frame, text="Clock In Time:", font=self.F_BOLD, 
                                  bg='white')
         clock_in_label.pack(side=tk.LEFT, padx=5)
         
         self.clock_in_entry = tk.Entry(clock_in_frame, textvariable=self.clock_in_time, width=10,
-                                      font=(self.font_family, 10), justify="center",
+                                      font=self.F_NORMAL, justify="center",
                                       relief=tk.SOLID, bd=1)
         self.clock_in_entry.pack(side=tk.LEFT, padx=5)
         
@@ -594,12 +850,12 @@ class ClockReminderApp:
         clock_out_frame = tk.Frame(times_content, bg='white')
         clock_out_frame.pack(fill="x", pady=5)
         
-        clock_out_label = tk.Label(clock_out_frame, text="Clock Out Time:", font=(self.font_family, 10, "bold"), 
+        clock_out_label = tk.Label(clock_out_frame, text="Clock Out Time:", font=self.F_BOLD, 
                                   bg='white')
         clock_out_label.pack(side=tk.LEFT, padx=5)
         
         self.clock_out_entry = tk.Entry(clock_out_frame, textvariable=self.clock_out_time, width=10,
-                                       font=(self.font_family, 10), justify="center",
+                                       font=self.F_NORMAL, justify="center",
                                        relief=tk.SOLID, bd=1)
         self.clock_out_entry.pack(side=tk.LEFT, padx=5)
         
@@ -609,15 +865,16 @@ class ClockReminderApp:
         # Only show AM/PM dropdown if in 12-hour mode
         if self.time_format.get() == '12-hour':
             self.clock_out_ampm.pack(side=tk.LEFT, padx=5)
+        self._ampm_visible = self.time_format.get() == '12-hour'
         
         # Save preset button
         save_button = tk.Button(
             times_content, 
             text="Save as Preset", 
             command=self.save_preset,
-            bg=self.colors["primary"], 
+            bg=self.color_primary, 
             fg="white", 
-            font=(self.font_family, 9),
+            font=self.F_SMALL,
             relief=tk.RAISED,
             bd=1
         )
@@ -627,7 +884,7 @@ class ClockReminderApp:
         preset_frame = tk.Frame(times_content, bg='white')
         preset_frame.pack(fill="x", pady=5)
         
-        tk.Label(preset_frame, text="Load Preset:", font=(self.font_family, 10, "bold"), 
+        tk.Label(preset_frame, text="Load Preset:", font=self.F_BOLD, 
                 bg='white').pack(side=tk.LEFT, padx=5)
         
         self.preset_var = tk.StringVar()
@@ -635,17 +892,17 @@ class ClockReminderApp:
         self.preset_dropdown.pack(side=tk.LEFT, padx=5)
         self.preset_dropdown.bind("<<ComboboxSelected>>", self.load_preset)
         
-        # Update the presets list
-        self.update_preset_list()
+        # Fill the presets list the first time the dropdown is clicked
+        self._preset_click_id = self.preset_dropdown.bind("<Button-1>", self._populate_presets_once, add="+")
         
         # Format hint
         time_hint = "Format: HH:MM (24-hour)" if self.time_format.get() == '24-hour' else "Format: HH:MM (12-hour)"
         self.format_hint = tk.Label(times_content, text=time_hint, bg='white', 
-                                   fg=self.colors["text"], font=(self.font_family, 9, "italic"))
+                                   fg=self.color_text, font=self.F_HINT)
         self.format_hint.pack(pady=2)
         
         # Button Frame
-        button_frame = tk.Frame(self.main_frame, bg=self.colors["background"])
+        button_frame = tk.Frame(self.main_frame, bg=self.color_background)
         button_frame.pack(pady=15)
         
         # Custom button styling
@@ -653,14 +910,14 @@ class ClockReminderApp:
             button_frame, 
             text="Start Reminders", 
             command=self.toggle_reminders,
-            bg=self.colors["primary"], 
+            bg=self.color_primary, 
             fg="white", 
             width=15, 
             height=2,
-            font=(self.font_family, 10, "bold"),
+            font=self.F_BOLD,
             relief=tk.RAISED,
             bd=1,
-            activebackground=self.colors["primary"],
+            activebackground=self.color_primary,
             activeforeground="white"
         )
         self.start_button.pack(side=tk.LEFT, padx=5)
@@ -669,44 +926,29 @@ class ClockReminderApp:
             button_frame, 
             text="Test Notification", 
             command=self.test_notification,
-            bg=self.colors["primary"], 
+            bg=self.color_primary, 
             fg="white", 
             width=15, 
             height=2,
-            font=(self.font_family, 10, "bold"),
+            font=self.F_BOLD,
             relief=tk.RAISED,
             bd=1,
-            activebackground=self.colors["primary"],
+            activebackground=self.color_primary,
             activeforeground="white"
         )
         test_button.pack(side=tk.LEFT, padx=5)
         
-        # Add hover effects to buttons
-        self.start_button.bind("<Enter>", lambda e: self.on_button_hover(e, self.start_button))
-        self.start_button.bind("<Leave>", lambda e: self.on_button_leave(e, self.start_button))
-        test_button.bind("<Enter>", lambda e: self.on_button_hover(e, test_button))
-        test_button.bind("<Leave>", lambda e: self.on_button_leave(e, test_button))
-        save_button.bind("<Enter>", lambda e: self.on_button_hover(e, save_button))
-        save_button.bind("<Leave>", lambda e: self.on_button_leave(e, save_button))
-        
-        # Counter Frame - with animated counter
-        counter_frame = tk.Frame(self.main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        counter_frame.pack(fill="x", padx=10, pady=10)
+        # Add hover effects to buttons (colors captured once at bind time)
+        hover_bg, normal_bg = self.color_highlight, self.color_primary
+        for button in (self.start_button, test_button, save_button):
+            button.bind("<Enter>", lambda e, b=button: b.configure(bg=hover_bg))
+            button.bind("<Leave>", lambda e, b=button: b.configure(bg=normal_bg))
         
-        # Add a subtle header
-        counter_header = tk.Frame(counter_frame, bg=self.colors["primary"], height=8)
-        counter_header.pack(fill="x")
-        
-        counter_title = tk.Label(counter_frame, text="Statistics", font=(self.font_family, 12, "bold"), 
-                                bg='white', fg=self.colors["primary"])
-        counter_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner content
-        counter_content = tk.Frame(counter_frame, bg='white', padx=15, pady=10)
-        counter_content.pack(fill="x")
+        # Counter card - with animated counter
+        counter_content = self._make_card("Statistics")
         
         counter_label = tk.Label(counter_content, text="Reminder Days:", bg='white', 
-                                font=(self.font_family, 10, "bold"))
+                                font=self.F_BOLD)
         counter_label.pack(pady=5)
         
         # Canvas for animated counter
@@ -717,84 +959,45 @@ class ClockReminderApp:
         # Draw the counter value
         self.count_display = self.counter_canvas.create_text(
             50, 30, text=str(self.reminder_count), 
-            font=(self.font_family, 28, "bold"), fill=self.colors["primary"])
+            font=self.F_BIG, fill=self.color_primary)
         
         # Current time display with timezone
-        time_frame = tk.Frame(self.main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        time_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Add a subtle header
-        time_header = tk.Frame(time_frame, bg=self.colors["primary"], height=8)
-        time_header.pack(fill="x")
-        
-        time_title = tk.Label(time_frame, text="Current Time", font=(self.font_family, 12, "bold"), 
-                             bg='white', fg=self.colors["primary"])
-        time_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner content
-        time_content = tk.Frame(time_frame, bg='white', padx=15, pady=10)
-        time_content.pack(fill="x")
+        time_content = self._make_card("Current Time")
         
         self.time_display = tk.Label(time_content, text="", bg='white', 
-                                    font=(self.font_family, 16, "bold"), fg=self.colors["primary"])
+                                    font=self.F_TIME, fg=self.color_primary)
         self.time_display.pack(pady=5)
         
         # Start time display updating
         self.update_time_display()
         
         # Time until next event display with animation
-        next_event_frame = tk.Frame(self.main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        next_event_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Add a subtle header
-        next_event_header = tk.Frame(next_event_frame, bg=self.colors["primary"], height=8)
-        next_event_header.pack(fill="x")
-        
-        next_event_title = tk.Label(next_event_frame, text="Next Reminder", font=(self.font_family, 12, "bold"), 
-                                   bg='white', fg=self.colors["primary"])
-        next_event_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner content
-        next_event_content = tk.Frame(next_event_frame, bg='white', padx=15, pady=10)
-        next_event_content.pack(fill="x")
+        next_event_content = self._make_card("Next Reminder")
         
         # Text display for next event
         self.next_event_label = tk.Label(next_event_content, text="",
-                                       bg='white', font=(self.font_family, 11, "bold"), 
-                                       fg=self.colors["primary"])
+                                       bg='white', font=self.F_EVENT, 
+                                       fg=self.color_primary)
         self.next_event_label.pack(pady=(5, 10))
         
-        # Animated progress bar for countdown
-        self.countdown_canvas = tk.Canvas(next_event_content, width=400, height=40, 
-                                       bg='white', highlightthickness=0)
-        self.countdown_canvas.pack(pady=5)
-        
-        # Draw the progress bar background
-        self.progress_bg = self.countdown_canvas.create_rectangle(
-            10, 10, 390, 30, fill="#E0E0E0", outline="")
-        
-        # Draw the progress bar
-        self.progress_bar = self.countdown_canvas.create_rectangle(
-            10, 10, 10, 30, fill=self.colors["primary"], outline="")
-        
-        # Draw the time remaining text
-        self.countdown_text = self.countdown_canvas.create_text(
-            200, 20, text="00:00:00", font=(self.font_family, 12, "bold"), 
-            fill="black")
+        # Native progress bar for the countdown
+        self.progress = ttk.Progressbar(next_event_content, orient="horizontal", length=380,
+                                        mode="determinate", maximum=380,
+                                        style="Countdown.Horizontal.TProgressbar")
+        self.progress.pack(pady=(5, 10))
         
         # Status Label
-        self.status_frame = tk.Frame(self.main_frame, bg=self.colors["background"])
+        self.status_frame = tk.Frame(self.main_frame, bg=self.color_background)
         self.status_frame.pack(pady=10)
         
         self.status_label = tk.Label(self.status_frame, text="Ready to start", 
-                                    bg=self.colors["background"], fg=self.colors["text"], 
-                                    font=(self.font_family, 10, "italic"))
+                                    bg=self.color_background, fg=self.color_text, 
+                                    font=self.F_ITALIC)
         self.status_label.pack(pady=5)
         
         # Update button text based on current state
         if self.is_running:
-            self.start_button.config(text="Stop Reminders")
-            self.status_label.config(text="Reminders are active")
+            self._set_status("Stop Reminders", "Reminders are active")
     
     # =========================
     # Missing Functionality Implementations
@@ -802,36 +1005,63 @@ class ClockReminderApp:
     def load_data(self):
         """Load saved settings from a JSON file if it exists."""
         settings_file = self.data_dir / "settings.json"
-        if settings_file.exists():
-            try:
-                with open(settings_file, "r") as f:
-                    data = json.load(f)
-                    self.clock_in_time.set(data.get("clock_in_time", "09:00"))
-                    self.clock_out_time.set(data.get("clock_out_time", "17:00"))
-                    self.reminder_count = data.get("reminder_count", 0)
-                    self.time_format.set(data.get("time_format", "24-hour"))
-                    self.timezone.set(data.get("timezone", "Local"))
-                    self.is_running = data.get("is_running", False)
-            except Exception as e:
-                print(f"Error loading data: {e}")
+        try:
+            # Just read it; a missing file is the first-run case, not an error
+            data = _json_loads(settings_file.read_bytes())
+            self.clock_in_time.set(data.get("clock_in_time", "09:00"))
+            self.clock_out_time.set(data.get("clock_out_time", "17:00"))
+            self.reminder_count = data.get("reminder_count", 0)
+            self.time_format.set(data.get("time_format", "24-hour"))
+            self.timezone.set(data.get("timezone", "Local"))
+            self.is_running = data.get("is_running", False)
+            self._cached_icon_path = data.get("icon_path")
+            # The .set() calls above fired schedule_save; let that save see the settings as unchanged
+            self._last_saved = self._settings_payload()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading data: {e}")
     
-    def save_data(self):
-        """Save current settings to a JSON file."""
-        settings_file = self.data_dir / "settings.json"
+    def _settings_payload(self):
+        """Serialize the current settings as they are written to settings.json."""
         data = {
             "clock_in_time": self.clock_in_time.get(),
             "clock_out_time": self.clock_out_time.get(),
             "reminder_count": self.reminder_count,
             "time_format": self.time_format.get(),
             "timezone": self.timezone.get(),
-            "is_running": self.is_running
+            "is_running": self.is_running,
+            "icon_path": self._cached_icon_path
         }
+        return _json_dumps(data)
+    
+    def save_data(self):
+        """Save current settings to a JSON file."""
+        settings_file = self.data_dir / "settings.json"
+        payload = self._settings_payload()
+        # Nothing to do if the settings are exactly what was last written
+        if payload == self._last_saved:
+            return
         try:
-            with open(settings_file, "w") as f:
-                json.dump(data, f, indent=4)
+            # Write to a temp file and swap it in so a crash never leaves half-written JSON
+            tmp_file = settings_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, settings_file)
+            self._last_saved = payload
         except Exception as e:
             print(f"Error saving data: {e}")
     
+    def schedule_save(self, *args):
+        """Save settings 2 seconds after the last change, so bursts of changes cause one write."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(2000, self._flush_save)
+    
+    def _flush_save(self):
+        """Run the debounced save."""
+        self._save_after_id = None
+        self.save_data()
+    
     def save_preset(self):
         """Save current times as a preset."""
         preset_name = "Preset " + datetime.datetime.now().strftime("%Y%m%d%H%M%S")
@@ -840,293 +1070,313 @@ class ClockReminderApp:
             "clock_in_time": self.clock_in_time.get(),
             "clock_out_time": self.clock_out_time.get()
         }
+        presets = self._load_presets() + [preset]
         presets_file = self.data_dir / "presets.json"
-        presets = []
-        if presets_file.exists():
-            try:
-                with open(presets_file, "r") as f:
-                    presets = json.load(f)
-            except Exception as e:
-                print("Error loading presets, starting new.")
-        presets.append(preset)
         try:
-            with open(presets_file, "w") as f:
-                json.dump(presets, f, indent=4)
+            tmp_file = presets_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(_json_dumps(presets))
+            os.replace(tmp_file, presets_file)
+            self._presets_cache = presets
+            self._presets_mtime = presets_file.stat().st_mtime
             self.update_preset_list()
             messagebox.showinfo("Preset Saved", f"Preset '{preset_name}' saved successfully.")
         except Exception as e:
             print(f"Error saving preset: {e}")
     
-    def load_preset(self, event=None):
-        """Load the selected preset."""
+    def _load_presets(self):
+        """Return the saved presets, re-reading presets.json only when it has changed on disk."""
         presets_file = self.data_dir / "presets.json"
-        if presets_file.exists():
+        try:
+            mtime = presets_file.stat().st_mtime
+        except OSError:
+            return []
+        if self._presets_cache is None or mtime != self._presets_mtime:
             try:
-                with open(presets_file, "r") as f:
-                    presets = json.load(f)
-                selected = self.preset_var.get()
-                for preset in presets:
-                    if preset["name"] == selected:
-                        self.clock_in_time.set(preset.get("clock_in_time", "09:00"))
-                        self.clock_out_time.set(preset.get("clock_out_time", "17:00"))
-                        messagebox.showinfo("Preset Loaded", f"Preset '{selected}' loaded.")
-                        break
+                self._presets_cache = _json_loads(presets_file.read_bytes())
+                self._presets_mtime = mtime
             except Exception as e:
-                print("Error loading preset:", e)
+                print("Error loading presets:", e)
+                return []
+        return self._presets_cache
+    
+    def load_preset(self, event=None):
+        """Load the selected preset."""
+        selected = self.preset_var.get()
+        for preset in self._load_presets():
+            if preset["name"] == selected:
+                self.clock_in_time.set(preset.get("clock_in_time", "09:00"))
+                self.clock_out_time.set(preset.get("clock_out_time", "17:00"))
+                messagebox.showinfo("Preset Loaded", f"Preset '{selected}' loaded.")
+                break
+    
+    def _populate_presets_once(self, event=None):
+        """Load the presets list on first use of the dropdown."""
+        self.preset_dropdown.unbind("<Button-1>", self._preset_click_id)
+        self.update_preset_list()
     
     def update_preset_list(self):
         """Update the presets dropdown list."""
-        presets_file = self.data_dir / "presets.json"
-        presets_list = []
-        if presets_file.exists():
-            try:
-                with open(presets_file, "r") as f:
-                    presets = json.load(f)
-                presets_list = [preset["name"] for preset in presets]
-            except Exception as e:
-                print("Error updating preset list:", e)
+        presets_list = [preset["name"] for preset in self._load_presets()]
         self.preset_dropdown['values'] = presets_list
     
     def start_animations(self):
-        """Start dinosaur and countdown animations."""
-        self.animate_dinosaur()
-        #self.animate_countdown()
+        """Start the dinosaur animation and the once-per-second clock/countdown refresh."""
+        self._tick()
+        self._tick_second()
+    
+    def _tick(self):
+        """Advance the dinosaur every 100 ms."""
+        if self._visible:
+            self.animate_dinosaur()
+        self.root.after(100, self._tick)
+    
+    def _tick_second(self):
+        """Refresh the clock and countdown, then re-arm just after the next wall-clock second."""
+        if self._visible:
+            self.update_time_display()
+            self.update_time_remaining()
+        # A few ms past the boundary so the next call always sees the new second
+        self.root.after(1005 - int(time.time() * 1000) % 1000, self._tick_second)
     
     def animate_dinosaur(self):
         """Animate the dinosaur by updating its position."""
         self.dino_position += self.dino_direction
         if self.dino_position > 20 or self.dino_position < 0:
             self.dino_direction *= -1
-        self.draw_dinosaur()
-        self.root.after(100, self.animate_dinosaur)
-    
-    def animate_countdown(self):
-        """Animate the countdown timer."""
-        # For demonstration, count down from 1 hour (3600 seconds) repeatedly
-        total_seconds = 3600 - (int(time.time()) % 3600)
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        countdown_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        self.countdown_canvas.itemconfig(self.countdown_text, text=countdown_str)
-        progress = (3600 - total_seconds) / 3600 * 380
-        self.countdown_canvas.coords(self.progress_bar, 10, 10, 10 + progress, 30)
-        self.root.after(1000, self.animate_countdown)
+        self._queue_ui("dino", self.draw_dinosaur)
     
-    def update_time_remaining(self):
-        """Update the display for the next reminder."""
-        self.next_event_label.config(text="Next reminder in 1 hour")
-        self.root.after(60000, self.update_time_remaining)  # update every minute
+    def _queue_ui(self, key, func, *args, **kwargs):
+        """Queue a widget update for the next idle flush; a newer update for the same key replaces the older one."""
+        self._pending_ui[key] = (func, args, kwargs)
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._flush_ui)
+    
+    def _flush_ui(self):
+        """Apply all queued widget updates in a single pass."""
+        self._ui_flush_scheduled = False
+        pending, self._pending_ui = self._pending_ui, {}
+        for func, args, kwargs in pending.values():
+            func(*args, **kwargs)
+    
+    def _current_strings(self):
+        """Return (HH:MM:SS, hh:MM:SS AM/PM) for the current second, formatting at most once per second."""
+        epoch = int(time.time())
+        if epoch != self._time_cache[0]:
+            now = datetime.datetime.now()
+            self._time_cache = (
+                epoch,
+                now.strftime("%H:%M:%S"),
+                now.strftime("%I:%M:%S %p"),
+            )
+        return self._time_cache[1:]
     
     def update_time_display(self):
         """Update the current time display."""
-        now = datetime.datetime.now()
+        time_24h, time_12h = self._current_strings()
         if self.time_format.get() == '12-hour':
-            current_time = now.strftime("%I:%M:%S %p")
+            current_time = time_12h
         else:
-            current_time = now.strftime("%H:%M:%S")
-        self.time_display.config(text=current_time)
-        self.root.after(1000, self.update_time_display)
+            current_time = time_24h
+        if current_time != self._last_time_str:
+            self._last_time_str = current_time
+            self._queue_ui("time_display", self.time_display.config, text=current_time)
     
     def start_reminders(self):
-        """Start the reminder loop in a separate thread."""
-        if self.reminder_thread is None or not self.reminder_thread.is_alive():
-            self.reminder_thread = threading.Thread(target=self.reminder_loop, daemon=True)
-            self.reminder_thread.start()
-    
-    def reminder_loop(self):
-        """A simple loop to check the time and send notifications."""
-        while self.is_running:
-            now = datetime.datetime.now().strftime("%H:%M")
-            if now == self.clock_in_time.get():
-                show_notification("Clock In Reminder", "It's time to clock in!", root=self.root, icon_path=self.icon_path)
-                self.reminder_count += 1
-                self.update_counter()
-                time.sleep(60)  # Avoid multiple notifications
-            elif now == self.clock_out_time.get():
-                show_notification("Clock Out Reminder", "It's time to clock out!", root=self.root, icon_path=self.icon_path)
-                self.reminder_count += 1
-                self.update_counter()
-                time.sleep(60)
-            time.sleep(10)
+        """Schedule a single Tk timer for the next clock in/out event."""
+        self.cancel_reminders()
+        event_type, event_time = self.get_next_event()
+        if event_time is None:
+            return
+        self._reminder_event = event_type
+        self._reminder_due = event_time
+        self._arm_reminder()
+    
+    def _arm_reminder(self):
+        """Arm the Tk timer for the exact time left until the pending reminder is due."""
+        delay_ms = max(0, int((self._reminder_due - datetime.datetime.now()).total_seconds() * 1000))
+        self._reminder_after_id = self.root.after(delay_ms, self._fire_reminder)
+    
+    def cancel_reminders(self):
+        """Cancel the pending reminder timer, if any."""
+        if self._reminder_after_id is not None:
+            self.root.after_cancel(self._reminder_after_id)
+            self._reminder_after_id = None
+    
+    def _fire_reminder(self):
+        """Send the due reminder and schedule the next one."""
+        self._reminder_after_id = None
+        # The timer can run early (ms rounding, system clock changes); wait out the rest instead
+        # of notifying, otherwise start_reminders would pick the same event again
+        if datetime.datetime.now() < self._reminder_due:
+            self._arm_reminder()
+            return
+        if self._reminder_event == "Clock In":
+            show_notification("Clock In Reminder", "It's time to clock in!", root=self.root, icon_path=self.icon_path)
+        else:
+            show_notification("Clock Out Reminder", "It's time to clock out!", root=self.root, icon_path=self.icon_path)
+        self.reminder_count += 1
+        self.update_counter()
+        self.schedule_save()
+        self.start_reminders()
+    
+    def _on_times_changed(self, *args):
+        """Reschedule the pending reminder when the clock in/out settings change."""
+        self._invalidate_times()
+        if self.is_running:
+            self.start_reminders()
     
     def update_counter(self):
         """Update the animated counter display."""
-        self.counter_canvas.itemconfig(self.count_display, text=str(self.reminder_count))
+        if self.reminder_count != self._last_count_shown:
+            self._last_count_shown = self.reminder_count
+            self._queue_ui("counter", self.counter_canvas.itemconfig, self.count_display, text=str(self.reminder_count))
     
     def toggle_reminders(self):
         """Toggle the reminder system on or off."""
         self.is_running = not self.is_running
         if self.is_running:
-            self.start_button.config(text="Stop Reminders")
-            self.status_label.config(text="Reminders are active")
+            self._set_status("Stop Reminders", "Reminders are active")
             self.start_reminders()
         else:
-            self.start_button.config(text="Start Reminders")
-            self.status_label.config(text="Reminders stopped")
+            self._set_status("Start Reminders", "Reminders stopped")
+            self.cancel_reminders()
+        self.schedule_save()
+    
+    def _set_status(self, button_text, status_text):
+        """Update the start/stop button and status line together."""
+        self.start_button.configure(text=button_text)
+        self.status_label.configure(text=status_text)
     
     def on_close(self):
         """Handle application close: save data and exit."""
+        self.cancel_reminders()
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         self.save_data()
+        self.scroll_canvas.tk.eval(self._unbind_wheel_script)
         self.root.destroy()
     
     def update_time_format(self, event=None):
         """Update UI based on selected time format."""
-        if self.time_format.get() == '12-hour':
-            if not self.clock_in_ampm.winfo_ismapped():
-                self.clock_in_ampm.pack(side=tk.LEFT, padx=5)
-            if not self.clock_out_ampm.winfo_ismapped():
-                self.clock_out_ampm.pack(side=tk.LEFT, padx=5)
+        show_ampm = self.time_format.get() == '12-hour'
+        if show_ampm == self._ampm_visible:
+            return
+        self._ampm_visible = show_ampm
+        if show_ampm:
+            self.clock_in_ampm.pack(side=tk.LEFT, padx=5)
+            self.clock_out_ampm.pack(side=tk.LEFT, padx=5)
             self.format_hint.config(text="Format: HH:MM (12-hour)")
         else:
-            if self.clock_in_ampm.winfo_ismapped():
-                self.clock_in_ampm.pack_forget()
-            if self.clock_out_ampm.winfo_ismapped():
-                self.clock_out_ampm.pack_forget()
+            self.clock_in_ampm.pack_forget()
+            self.clock_out_ampm.pack_forget()
             self.format_hint.config(text="Format: HH:MM (24-hour)")
     
-    def on_button_hover(self, event, button):
-        """Change button color on hover."""
-        button.config(bg=self.colors["highlight"])
-    
-    def on_button_leave(self, event, button):
-        """Reset button color when not hovered."""
-        button.config(bg=self.colors["primary"])
-    
     def test_notification(self):
         """Test the notification system."""
         show_notification("Test Notification", "This is a test notification.", root=self.root, icon_path=self.icon_path)
     
         # Add these new methods inside your ClockReminderApp class
 
-    def get_next_event(self):
-        """Determine the next event (Clock In or Clock Out) and return its type and datetime."""
-        now = datetime.datetime.now()
-        today = now.date()
-        try:
+    def _invalidate_times(self, *args):
+        """Mark the parsed clock in/out times as stale after an edit."""
+        self._times_dirty = True
+        self._countdown = None
+    
+    def _event_times(self):
+        """Return the parsed (clock in, clock out) times, re-parsing only after a change."""
+        if self._times_dirty:
             if self.time_format.get() == '12-hour':
-                clock_in_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_in_time.get() + " " + self.clock_in_ampm.get(), "%I:%M %p").time()
-                )
-                clock_out_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_out_time.get() + " " + self.clock_out_ampm.get(), "%I:%M %p").time()
-                )
+                clock_in = parse_hhmm(self.clock_in_time.get(), self.clock_in_ampm.get())
+                clock_out = parse_hhmm(self.clock_out_time.get(), self.clock_out_ampm.get())
             else:
-                clock_in_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_in_time.get(), "%H:%M").time()
-                )
-                clock_out_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_out_time.get(), "%H:%M").time()
-                )
+                clock_in = parse_hhmm(self.clock_in_time.get())
+                clock_out = parse_hhmm(self.clock_out_time.get())
+            self._clock_in_time_obj, self._clock_out_time_obj = clock_in, clock_out
+            self._times_dirty = False
+        return self._clock_in_time_obj, self._clock_out_time_obj
+
+    def _current_interval(self, now):
+        """Return (prev_type, prev_dt, next_type, next_dt) for the interval containing now, or None on a bad time."""
+        try:
+            clock_in, clock_out = self._event_times()
         except Exception as e:
             print("Error parsing time:", e)
-            return None, None
+            return None
+        
+        # The event datetimes only change at midnight or when the times are edited
+        key = (now.day, clock_in, clock_out)
+        if key != self._day_events[0]:
+            today = now.date()
+            one_day = datetime.timedelta(days=1)
+            clock_in_dt = datetime.datetime.combine(today, clock_in)
+            clock_out_dt = datetime.datetime.combine(today, clock_out)
+            self._day_events = (key, clock_in_dt, clock_out_dt,
+                                clock_out_dt - one_day, clock_in_dt + one_day)
+        _, clock_in_dt, clock_out_dt, yesterday_out_dt, tomorrow_in_dt = self._day_events
 
         if now < clock_in_dt:
-            return "Clock In", clock_in_dt
+            # Between yesterday's Clock Out and today's Clock In
+            return "Clock Out", yesterday_out_dt, "Clock In", clock_in_dt
         elif now < clock_out_dt:
-            return "Clock Out", clock_out_dt
+            return "Clock In", clock_in_dt, "Clock Out", clock_out_dt
         else:
             # After clock out, next event is tomorrow's Clock In.
-            tomorrow = today + datetime.timedelta(days=1)
-            if self.time_format.get() == '12-hour':
-                next_clock_in = datetime.datetime.combine(
-                    tomorrow, 
-                    datetime.datetime.strptime(self.clock_in_time.get() + " " + self.clock_in_ampm.get(), "%I:%M %p").time()
-                )
-            else:
-                next_clock_in = datetime.datetime.combine(
-                    tomorrow, 
-                    datetime.datetime.strptime(self.clock_in_time.get(), "%H:%M").time()
-                )
-            return "Clock In", next_clock_in
+            return "Clock Out", clock_out_dt, "Clock In", tomorrow_in_dt
 
-    def get_previous_event(self):
-        """Determine the previous event (used for progress bar calculation)."""
-        now = datetime.datetime.now()
-        today = now.date()
-        try:
-            if self.time_format.get() == '12-hour':
-                clock_in_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_in_time.get() + " " + self.clock_in_ampm.get(), "%I:%M %p").time()
-                )
-                clock_out_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_out_time.get() + " " + self.clock_out_ampm.get(), "%I:%M %p").time()
-                )
-            else:
-                clock_in_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_in_time.get(), "%H:%M").time()
-                )
-                clock_out_dt = datetime.datetime.combine(
-                    today, 
-                    datetime.datetime.strptime(self.clock_out_time.get(), "%H:%M").time()
-                )
-        except Exception as e:
-            print("Error parsing time:", e)
+    def get_next_event(self):
+        """Determine the next event (Clock In or Clock Out) and return its type and datetime."""
+        interval = self._current_interval(datetime.datetime.now())
+        if interval is None:
             return None, None
-
-        if now < clock_in_dt:
-            # Previous event is yesterday's Clock Out.
-            yesterday = today - datetime.timedelta(days=1)
-            if self.time_format.get() == '12-hour':
-                prev_event = datetime.datetime.combine(
-                    yesterday, 
-                    datetime.datetime.strptime(self.clock_out_time.get() + " " + self.clock_out_ampm.get(), "%I:%M %p").time()
-                )
-            else:
-                prev_event = datetime.datetime.combine(
-                    yesterday, 
-                    datetime.datetime.strptime(self.clock_out_time.get(), "%H:%M").time()
-                )
-            return "Clock Out", prev_event
-        elif now < clock_out_dt:
-            return "Clock In", clock_in_dt
-        else:
-            return "Clock Out", clock_out_dt
+        return interval[2], interval[3]
 
     def update_time_remaining(self):
         """Update the countdown timer and progress bar until the next event."""
-        event_type, event_time = self.get_next_event()
-        if event_time is None:
-            self.next_event_label.config(text="Invalid time format")
-            self.root.after(1000, self.update_time_remaining)
-            return
+        mono = time.monotonic()
+        if self._countdown is None or mono >= self._countdown_resync:
+            now = datetime.datetime.now()
+            interval = self._current_interval(now)
+            if interval is None:
+                self._set_next_event_text("Invalid time format")
+                self._last_hms = None
+                return
+            prev_event_time, event_type, event_time = interval[1:]
+            deadline = mono + (event_time - now).total_seconds()
+            self._countdown = (event_type, deadline, (event_time - prev_event_time).total_seconds())
+            # Re-anchor to the wall clock at the event, or after a minute in case the system slept
+            self._countdown_resync = min(deadline, mono + 60)
+        event_type, deadline, total_interval = self._countdown
 
-        now = datetime.datetime.now()
-        remaining = event_time - now
-        total_seconds = int(remaining.total_seconds())
-        if total_seconds < 0:
-            total_seconds = 0
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        countdown_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        self.next_event_label.config(text=f"Next {event_type} in {countdown_str}")
+        # Between re-anchors the countdown is plain monotonic float math
+        remaining = deadline - mono
+        total_seconds = max(0, int(remaining))
+        minutes, seconds = divmod(total_seconds, 60)
+        hms = divmod(minutes, 60) + (seconds,)
+        # Only format the label when the countdown actually changed
+        if (event_type, hms) != self._last_hms:
+            self._last_hms = (event_type, hms)
+            self._set_next_event_text("Next %s in %02d:%02d:%02d" % ((event_type,) + hms))
 
         # Update progress bar based on the interval from the previous event.
-        prev_event_type, prev_event_time = self.get_previous_event()
-        if prev_event_time is not None:
-            total_interval = (event_time - prev_event_time).total_seconds()
-            elapsed = (now - prev_event_time).total_seconds()
-            progress = (elapsed / total_interval) * 380  # 380 is the total width for the progress bar.
-            if progress > 380:
-                progress = 380
-            self.countdown_canvas.coords(self.progress_bar, 10, 10, 10 + progress, 30)
+        elapsed = total_interval - remaining
+        px = int(min(380, elapsed / total_interval * 380))  # whole pixels of the 380 px bar
+        if px != self._last_progress_px:
+            self._last_progress_px = px
+            self._queue_ui("progress", self.progress.configure, value=px)
 
-        self.root.after(1000, self.update_time_remaining)
+    def _set_next_event_text(self, text):
+        """Update the next event label only when its text changes."""
+        if text != self._last_next_event_text:
+            self._last_next_event_text = text
+            self._queue_ui("next_event", self.next_event_label.config, text=text)
 
     
     def create_scrollable_area(self):
         """Create a scrollable area for the main content."""
         # Create a canvas that fills the window
-        self.scroll_canvas = tk.Canvas(self.root, bg=self.colors["background"])
+        self.scroll_canvas = tk.Canvas(self.root, bg=self.color_background)
         self.scroll_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Create a vertical scrollbar linked to the canvas
@@ -1135,24 +1385,64 @@ class ClockReminderApp:
         self.scroll_canvas.configure(yscrollcommand=v_scrollbar.set)
         
         # Create a frame inside the canvas to hold your widgets
-        self.main_frame = tk.Frame(self.scroll_canvas, bg=self.colors["background"])
+        self.main_frame = tk.Frame(self.scroll_canvas, bg=self.color_background)
         self.scroll_canvas.create_window((0, 0), window=self.main_frame, anchor="nw")
         
         # Update the scroll region whenever the size of main_frame changes
         self.main_frame.bind("<Configure>", lambda e: self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all")))
         
-        # Bind mouse wheel events to the canvas (works on Windows)
-        self.scroll_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Scroll with the mouse wheel entirely inside Tcl, without calling back into Python.
+        # <MouseWheel> reports 120 per notch on Windows but small deltas on macOS and trackpads,
+        # so truncate like int(-delta/120) and still move one unit for any nonzero delta.
+        # Linux sends Button-4/5 instead.
+        # The global bindings only exist while the pointer is over the canvas.
+        canvas = str(self.scroll_canvas)
+        wheel = {
+            "<MouseWheel>": f"{canvas} yview scroll [expr {{abs(%%D) >= 120 ? int(-%%D/120.0) : (%%D > 0 ? -1 : (%%D < 0 ? 1 : 0))}}] units; break",
+            "<Button-4>": f"{canvas} yview scroll -1 units; break",
+            "<Button-5>": f"{canvas} yview scroll 1 units; break",
+        }
+        bind_wheel = "; ".join(f"bind all {seq} {{{cmd}}}" for seq, cmd in wheel.items())
+        self._unbind_wheel_script = "; ".join(f"bind all {seq} {{}}" for seq in wheel)
+        self.scroll_canvas.tk.eval(f"bind {canvas} <Enter> {{+{bind_wheel}}}")
+        # Moving onto a child of the canvas also sends <Leave> (NotifyInferior); keep scrolling then
+        self.scroll_canvas.tk.eval(
+            f'bind {canvas} <Leave> {{+if {{"%d" ne "NotifyInferior"}} {{{self._unbind_wheel_script}}}}}')
 
 
 
 # ========================================================================================
 # MAIN EXECUTION
 # ========================================================================================
-if __name__ == "__main__":
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window while checking dependencies
+def _provision_macos():
+    """Create the macOS wrapper, notification helper and app bundle on first launch"""
+    marker = Path.home() / ".clock_reminder_provisioned"
+    if marker.exists():
+        return
+    try:
+        import macos_fixes
+        macos_fixes.fix_macos_app_settings()
+        marker.touch()
+    except Exception as e:
+        print(f"Error provisioning macOS app: {e}")
+
+def _post_paint_init():
+    """Run startup work that is not needed to show the window once it has been drawn"""
     check_dependencies()
-    root.deiconify()  # Show the main window
+    if PLATFORM == 'darwin':
+        # Initialize AppKit for Dock support
+        try:
+            from AppKit import NSApplication
+            NSApplication.sharedApplication()
+        except ImportError:
+            pass
+        threading.Thread(target=_provision_macos, daemon=True).start()
+
+def main():
+    root = tk.Tk()
     app = ClockReminderApp(root)
+    root.after_idle(_post_paint_init)
     root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -44,7 +44,7 @@ def install_dependencies():
     elif PLATFORM == 'darwin':  # macOS
         dependencies.append("rumps")
     elif PLATFORM == 'linux':
-        dependencies.extend(["pystray", "PyGObject"])
+        dependencies.extend(["pystray", "PyGObject", "jeepney"])
     
     # Install using pip
     for package in dependencies:
@@ -8,19 +8,74 @@ import datetime
 import json
 import os
 import sys
-import threading
 from pathlib import Path
 import math
+import re
 import random
+import importlib.util
 
-# Try importing pytz
+# pytz is large; only check that it is installed here and import it when a timezone is picked
+HAVE_PYTZ = importlib.util.find_spec("pytz") is not None
+if not HAVE_PYTZ:
+    print("pytz not installed. Timezone functionality will be limited.")
+
+# Prefer the C-accelerated orjson when it is installed; both sides work on bytes
 try:
-    import pytz
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
 except ImportError:
-    print("pytz not installed. Timezone functionality will be limited.")
-    pytz = None
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Values used when the saved data file (or a preset) leaves a field out
+_DEFAULTS = {
+    "clock_in_time": "09:00",
+    "clock_out_time": "17:00",
+    "reminder_count": 0,
+    "is_running": False,
+    "time_format": "24-hour",
+    "timezone": "Local",
+    "clock_in_ampm": "AM",
+    "clock_out_ampm": "PM",
+}
+
+# "H:M" through "HH:MM"; the hour range is checked per time format
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})")
+
+def write_json_atomic(path, obj):
+    """Write obj as compact JSON via a temp file, so an interrupted save never leaves a truncated file"""
+    data = _json_dumps(obj)
+    tmp_path = Path(path).with_suffix(".json.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 class ClockReminderApp:
+    # Time format hints, shared by every instance
+    _HINT_12H = "Format: HH:MM (12-hour)"
+    _HINT_24H = "Format: HH:MM (24-hour)"
+
+    # Dinosaur pixels (8x8 grid), shared by every instance
+    _DINO_PIXELS = (
+        # Body (darker green)
+        (1, 3), (1, 4), (1, 5),
+        (2, 2), (2, 3), (2, 4), (2, 5), (2, 6),
+        (3, 1), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7),
+        (4, 1), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6),
+        (5, 2), (5, 3), (5, 4), (5, 5),
+    )
+    _DINO_EYE = (3, 2)
+    
+    # Alternate legs for walking animation
+    _DINO_LEGS = (
+        ((2, 7), (4, 7)),
+        ((3, 7), (5, 7)),
+    )
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Clock In/Out Reminder")
@@ -39,34 +94,92 @@ class ClockReminderApp:
             "text": "#31473A",       # Dark green
         }
         
+        # RGB tuples for each color, parsed once
+        self.colors_rgb = {name: tuple(bytes.fromhex(value[1:])) for name, value in self.colors.items()}
+        
+        # Hover color: primary darkened by 20%, computed once
+        r, g, b = self.colors_rgb["primary"]
+        self._hover_bg = f"#{int(r * 0.8):02x}{int(g * 0.8):02x}{int(b * 0.8):02x}"
+        
         self.root.configure(bg=self.colors["background"])
         
         # Configure fonts - use system default font
         self.font_family = "Arial"  # Default, works on macOS
         
         # Variables
-        self.clock_in_time = tk.StringVar(value="09:00")
-        self.clock_out_time = tk.StringVar(value="17:00")
+        self.clock_in_time = tk.StringVar(value=_DEFAULTS["clock_in_time"])
+        self.clock_out_time = tk.StringVar(value=_DEFAULTS["clock_out_time"])
         self.reminder_count = 0
         self.is_running = False
-        self.reminder_thread = None
-        self.time_format = tk.StringVar(value="24-hour")
-        self.timezone = tk.StringVar(value="Local")
+        self._reminder_after_id = None
+        self._last_reminder_date = None
+        self.time_format = tk.StringVar(value=_DEFAULTS["time_format"])
+        self.timezone = tk.StringVar(value=_DEFAULTS["timezone"])
         self.animation_active = False
+        self.clock_in_ampm = None  # AM/PM selectors, built in create_widgets
+        self.clock_out_ampm = None
+        self._tz_cache = {}
+        self._dirty = False  # unsaved changes since the last save_data()
+        self._counter_after_id = None
+        self._counter_frames = []
+        self._counter_shown = 0
+        self._last_second = 0
         self.dino_position = 0
         self.dino_direction = 1
+        self._bit_pool = [(random.randint(10, 90), random.randint(10, 50), random.randint(1, 2))
+                          for _ in range(256)]
+        self._bit_idx = 0
         
         # Load saved data
         self.load_data()
+        self._presets = self.load_presets()  # kept in memory; the file is only written
+        self._is_12h = self.time_format.get() == '12-hour'
         
         # Create UI
         self.create_background()
         self.create_widgets()
         self.start_animations()
         
-        # Start reminder thread if app was previously running
+        # Keep the 24h reminder targets in sync with the inputs
+        self._clock_in_24h = self._clock_out_24h = None
+        self._targets = ()
+        for var in (self.clock_in_time, self.clock_out_time, self.time_format, self.timezone):
+            var.trace_add("write", self._recompute_targets)
+        self.clock_in_ampm.bind("<<ComboboxSelected>>", self._recompute_targets, add="+")
+        self.clock_out_ampm.bind("<<ComboboxSelected>>", self._recompute_targets, add="+")
+        self._recompute_targets()
+        
+        # Only write settings when something actually changed
+        for var in (self.clock_in_time, self.clock_out_time, self.time_format, self.timezone):
+            var.trace_add("write", self._mark_dirty)
+        self.clock_in_ampm.bind("<<ComboboxSelected>>", self._mark_dirty, add="+")
+        self.clock_out_ampm.bind("<<ComboboxSelected>>", self._mark_dirty, add="+")
+        
+        # Start reminders if app was previously running
         if self.is_running:
             self.start_reminders()
+        
+        # Flush unsaved changes on exit
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Pause the animation and clock redraws while the window is minimized
+        self._visible = True
+        self.root.bind("<Map>", self._on_map_change, add="+")
+        self.root.bind("<Unmap>", self._on_map_change, add="+")
+
+    def _on_map_change(self, event):
+        """Track whether the main window is shown, so hidden frames skip their redraws."""
+        if event.widget is self.root:
+            self._visible = event.type == tk.EventType.Map
+
+    def _mark_dirty(self, *args):
+        """Flag the settings as changed so the next save_data() writes them"""
+        self._dirty = True
+
+    def on_close(self):
+        """Save pending changes and close the window"""
+        self.save_data()
+        self.root.destroy()
 
     def get_data_dir(self):
         """Get platform-specific data directory for app files"""
@@ -83,66 +196,70 @@ class ClockReminderApp:
         self.main_frame = tk.Frame(self.root, bg=self.colors["background"], highlightthickness=0)
         self.main_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER, relwidth=0.95, relheight=0.95)
 
-    def draw_dinosaur(self):
-        """Draw a pixelated dinosaur"""
-        # Clear canvas
-        self.dino_canvas.delete("all")
-        
+    def create_dino_items(self):
+        """Pre-render the dinosaur's two walking frames and create its canvas items once"""
         # Pixel size
         pixel_size = 4
         
-        # Dinosaur position (8x8 grid)
-        x_pos = self.dino_position
-        
-        # Draw pixels for dinosaur
-        dino_pixels = [
-            # Body (darker green)
-            (1, 3), (1, 4), (1, 5),
-            (2, 2), (2, 3), (2, 4), (2, 5), (2, 6),
-            (3, 1), (3, 2), (3, 3), (3, 4), (3, 5), (3, 6), (3, 7),
-            (4, 1), (4, 2), (4, 3), (4, 4), (4, 5), (4, 6),
-            (5, 2), (5, 3), (5, 4), (5, 5),
-            # Eye (white)
-            (3, 2),
-            # Legs (dynamic based on position)
-            (2, 7), (4, 7)
+        # Each frame is written into a PhotoImage with one put() of row data
+        self.dino_frames = []
+        for leg_pixels in self._DINO_LEGS:
+            grid = [[self.colors["background"]] * 8 for _ in range(8)]
+            for px, py in self._DINO_PIXELS + leg_pixels:
+                grid[py][px] = self.colors["primary"]
+            grid[self._DINO_EYE[1]][self._DINO_EYE[0]] = 'white'
+            rows = []
+            for grid_row in grid:
+                row = " ".join(color for color in grid_row for _ in range(pixel_size))
+                rows.extend(["{" + row + "}"] * pixel_size)
+            frame = tk.PhotoImage(width=8 * pixel_size, height=8 * pixel_size)
+            frame.put(" ".join(rows), to=(0, 0))
+            self.dino_frames.append(frame)
+        
+        self.dino_item = self.dino_canvas.create_image(0, 0, anchor="nw", image=self.dino_frames[0])
+        self._dino_frame_shown = 0
+        
+        # Small pixels representing flying bits
+        self.dino_bits = [
+            self.dino_canvas.create_rectangle(0, 0, 0, 0, fill=self.colors["text"], outline='')
+            for _ in range(3)
         ]
+
+    def draw_dinosaur(self):
+        """Move the dinosaur sprite and show the current walking frame"""
+        # Pixel size
+        pixel_size = 4
+        
+        self.dino_canvas.coords(self.dino_item, self.dino_position * pixel_size, 0)
         
         # Alternate legs for walking animation
-        leg_pixels = []
-        if self.dino_position % 8 < 4:
-            leg_pixels = [(2, 7), (4, 7)]
-        else:
-            leg_pixels = [(3, 7), (5, 7)]
-        
-        # Draw dinosaur body
-        for px, py in dino_pixels:
-            if (px, py) == (3, 2):  # Eye
-                self.dino_canvas.create_rectangle(
-                    (x_pos + px) * pixel_size, py * pixel_size,
-                    (x_pos + px + 1) * pixel_size, (py + 1) * pixel_size,
-                    fill='white', outline='')
-            else:
-                self.dino_canvas.create_rectangle(
-                    (x_pos + px) * pixel_size, py * pixel_size,
-                    (x_pos + px + 1) * pixel_size, (py + 1) * pixel_size,
-                    fill=self.colors["primary"], outline='')
-        
-        # Draw legs
-        for px, py in leg_pixels:
-            self.dino_canvas.create_rectangle(
-                (x_pos + px) * pixel_size, py * pixel_size,
-                (x_pos + px + 1) * pixel_size, (py + 1) * pixel_size,
-                fill=self.colors["primary"], outline='')
-        
-        # Draw some small pixels representing flying bits
-        for _ in range(3):
-            px = random.randint(10, 90)
-            py = random.randint(10, 50)
-            size = random.randint(1, 2)
-            self.dino_canvas.create_rectangle(
-                px, py, px + size, py + size,
-                fill=self.colors["text"], outline='')
+        frame = 0 if self.dino_position % 8 < 4 else 1
+        if frame != self._dino_frame_shown:
+            self._dino_frame_shown = frame
+            self.dino_canvas.itemconfigure(self.dino_item, image=self.dino_frames[frame])
+        
+        # Move the small pixels representing flying bits, cycling through the pre-generated pool
+        for bit in self.dino_bits:
+            px, py, size = self._bit_pool[self._bit_idx]
+            self._bit_idx = (self._bit_idx + 1) & 255
+            self.dino_canvas.coords(bit, px, py, px + size, py + size)
+
+    def _make_card(self, title=None, pady=10):
+        """Create a white card in the main frame and return its content frame"""
+        card = tk.Frame(self.main_frame, bg='white', relief=tk.RIDGE, bd=1)
+        card.pack(fill="x", padx=10, pady=pady)
+        
+        # Add a subtle header
+        tk.Frame(card, bg=self.colors["primary"], height=8).pack(fill="x")
+        
+        if title:
+            tk.Label(card, text=title, font=(self.font_family, 12, "bold"), 
+                     bg='white', fg=self.colors["primary"]).pack(anchor="w", padx=15, pady=(10, 5))
+        
+        # Inner padding frame
+        content = tk.Frame(card, bg='white', padx=15, pady=10)
+        content.pack(fill="x")
+        return content
 
     def create_widgets(self):
         # Dinosaur Animation canvas
@@ -150,7 +267,8 @@ class ClockReminderApp:
                                     bg=self.colors["background"], highlightthickness=0)
         self.dino_canvas.pack(pady=(10, 5))
         
-        # Draw initial dinosaur
+        # Create the dinosaur once and draw its first frame
+        self.create_dino_items()
         self.draw_dinosaur()
         
         # Title
@@ -160,21 +278,7 @@ class ClockReminderApp:
         title_label.pack(pady=(0, 15))
         
         # Create card-like container for settings
-        settings_frame = tk.Frame(self.main_frame, bg='white', 
-                                 relief=tk.RIDGE, bd=1)
-        settings_frame.pack(fill="x", padx=10, pady=5)
-        
-        # Add a subtle header
-        settings_header = tk.Frame(settings_frame, bg=self.colors["primary"], height=8)
-        settings_header.pack(fill="x")
-        
-        settings_title = tk.Label(settings_frame, text="Settings", font=(self.font_family, 12, "bold"), 
-                                 bg='white', fg=self.colors["primary"])
-        settings_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner padding frame
-        settings_content = tk.Frame(settings_frame, bg='white', padx=15, pady=10)
-        settings_content.pack(fill="x")
+        settings_content = self._make_card("Settings", pady=5)
         
         # Time Format Settings
         format_frame = tk.Frame(settings_content, bg='white')
@@ -198,7 +302,7 @@ class ClockReminderApp:
         timezone_options = ttk.Combobox(timezone_frame, textvariable=self.timezone, width=25)
         
         # Only show timezone options if pytz is available
-        if pytz:
+        if HAVE_PYTZ:
             popular_timezones = ['Local', 'US/Eastern', 'US/Central', 'US/Mountain', 'US/Pacific', 
                                'Europe/London', 'Europe/Paris', 'Asia/Tokyo', 'Australia/Sydney']
             timezone_options['values'] = popular_timezones
@@ -209,21 +313,7 @@ class ClockReminderApp:
         timezone_options.pack(side=tk.LEFT, padx=5)
         
         # Create card-like container for time inputs
-        times_frame = tk.Frame(self.main_frame, bg='white', 
-                              relief=tk.RIDGE, bd=1)
-        times_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Add a subtle header
-        times_header = tk.Frame(times_frame, bg=self.colors["primary"], height=8)
-        times_header.pack(fill="x")
-        
-        times_title = tk.Label(times_frame, text="Reminder Times", font=(self.font_family, 12, "bold"), 
-                              bg='white', fg=self.colors["primary"])
-        times_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner padding frame
-        times_content = tk.Frame(times_frame, bg='white', padx=15, pady=10)
-        times_content.pack(fill="x")
+        times_content = self._make_card("Reminder Times")
         
         # Clock In Frame
         clock_in_frame = tk.Frame(times_content, bg='white')
@@ -294,7 +384,7 @@ class ClockReminderApp:
         self.update_preset_list()
         
         # Format hint
-        time_hint = "Format: HH:MM (24-hour)" if self.time_format.get() == '24-hour' else "Format: HH:MM (12-hour)"
+        time_hint = self._HINT_12H if self._is_12h else self._HINT_24H
         self.format_hint = tk.Label(times_content, text=time_hint, bg='white', 
                                    fg=self.colors["text"], font=(self.font_family, 9, "italic"))
         self.format_hint.pack(pady=2)
@@ -332,21 +422,13 @@ class ClockReminderApp:
         )
         test_button.pack(side=tk.LEFT, padx=5)
         
-        # Counter Frame - with animated counter
-        counter_frame = tk.Frame(self.main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        counter_frame.pack(fill="x", padx=10, pady=10)
+        # Darken the primary buttons on hover
+        for button in (save_button, self.start_button, test_button):
+            button.bind("<Enter>", lambda e, b=button: self.on_button_hover(e, b))
+            button.bind("<Leave>", lambda e, b=button: self.on_button_leave(e, b))
         
-        # Add a subtle header
-        counter_header = tk.Frame(counter_frame, bg=self.colors["primary"], height=8)
-        counter_header.pack(fill="x")
-        
-        counter_title = tk.Label(counter_frame, text="Statistics", font=(self.font_family, 12, "bold"), 
-                                bg='white', fg=self.colors["primary"])
-        counter_title.pack(anchor="w", padx=15, pady=(10, 5))
-        
-        # Inner content
-        counter_content = tk.Frame(counter_frame, bg='white', padx=15, pady=10)
-        counter_content.pack(fill="x")
+        # Counter card - with animated counter
+        counter_content = self._make_card("Statistics")
         
         counter_label = tk.Label(counter_content, text="Reminder Days:", bg='white', 
                                 font=(self.font_family, 10, "bold"))
@@ -362,18 +444,10 @@ class ClockReminderApp:
             50, 30, text=str(self.reminder_count), 
             font=(self.font_family, 28, "bold"), fill=self.colors["primary"]
         )
+        self._counter_shown = self.reminder_count
         
-        # Current time display with selected timezone
-        time_frame = tk.Frame(self.main_frame, bg='white', relief=tk.RIDGE, bd=1)
-        time_frame.pack(fill="x", padx=10, pady=10)
-        
-        # Add a subtle header
-        time_header = tk.Frame(time_frame, bg=self.colors["primary"], height=8)
-        time_header.pack(fill="x")
-        
-        # Inner content
-        time_content = tk.Frame(time_frame, bg='white', padx=15, pady=10)
-        time_content.pack(fill="x")
+        # Current time display with selected timezone (untitled card)
+        time_content = self._make_card()
         
         tk.Label(time_content, text="Current Time:", bg='white', 
                 font=(self.font_family, 10, "bold")).pack(side=tk.LEFT, padx=5)
@@ -382,7 +456,7 @@ class ClockReminderApp:
                                     font=(self.font_family, 12, "bold"), fg=self.colors["primary"])
         self.time_display.pack(side=tk.LEFT, padx=5)
         
-        # Start time display updating
+        # Show the time right away; the UI tick keeps it current
         self.update_time_display()
         
         # Status Label
@@ -396,24 +470,11 @@ class ClockReminderApp:
         
         # Update button text based on current state
         if self.is_running:
-            self.start_button.config(text="Stop Reminders")
-            self.status_label.config(text="Reminders are active")
+            self._set_status("Stop Reminders", "Reminders are active")
 
     def on_button_hover(self, event, button):
         """Darken button on hover"""
-        # Convert hex to RGB
-        r = int(self.colors["primary"][1:3], 16)
-        g = int(self.colors["primary"][3:5], 16)
-        b = int(self.colors["primary"][5:7], 16)
-        
-        # Darken by 20%
-        r = max(0, int(r * 0.8))
-        g = max(0, int(g * 0.8))
-        b = max(0, int(b * 0.8))
-        
-        # Convert back to hex
-        darker_color = f"#{r:02x}{g:02x}{b:02x}"
-        button.config(bg=darker_color)
+        button.config(bg=self._hover_bg)
 
     def on_button_leave(self, event, button):
         """Restore button color on leave"""
@@ -434,21 +495,18 @@ class ClockReminderApp:
             }
             
             # Add AM/PM settings if in 12-hour mode
-            if self.time_format.get() == '12-hour' and hasattr(self, 'clock_in_ampm'):
+            if self.time_format.get() == '12-hour' and self.clock_in_ampm is not None:
                 preset_data["clock_in_ampm"] = self.clock_in_ampm.get()
                 preset_data["clock_out_ampm"] = self.clock_out_ampm.get()
             
-            # Load existing presets
-            presets = self.load_presets()
-            
-            # Add or update preset
+            # Add or update preset in the in-memory copy
+            presets = self._presets
             presets[preset_name] = preset_data
             
             # Save presets
             try:
                 preset_file = self.data_dir / "clock_reminder_presets.json"
-                with open(preset_file, "w") as f:
-                    json.dump(presets, f)
+                write_json_atomic(preset_file, presets)
                 
                 # Update presets dropdown
                 self.update_preset_list()
@@ -461,34 +519,26 @@ class ClockReminderApp:
         """Update the current time display with selected timezone"""
         try:
             # Get the current time in the selected timezone
-            if self.timezone.get() == 'Local' or not pytz:
-                now = datetime.datetime.now()
-            else:
-                # Use pytz to get the time in the selected timezone
-                try:
-                    tz = pytz.timezone(self.timezone.get())
-                    now = datetime.datetime.now(tz)
-                except:
-                    # Fallback to local time if timezone is invalid
-                    now = datetime.datetime.now()
+            tz = self._tz()
+            now = datetime.datetime.now(tz) if tz else datetime.datetime.now()
                     
             # Format the time according to the selected time format
-            if self.time_format.get() == '12-hour':
-                time_str = now.strftime("%I:%M:%S %p")
+            # (plain integer formatting is cheaper than strftime every second)
+            if self._is_12h:
+                hour = now.hour % 12 or 12
+                suffix = "PM" if now.hour >= 12 else "AM"
+                time_str = f"{hour:02d}:{now.minute:02d}:{now.second:02d} {suffix}"
             else:
-                time_str = now.strftime("%H:%M:%S")
+                time_str = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
                 
             # Add the timezone name
-            if self.timezone.get() != 'Local' and pytz:
+            if self.timezone.get() != 'Local' and HAVE_PYTZ:
                 time_str += f" ({self.timezone.get()})"
                 
             # Update the label
             self.time_display.config(text=time_str)
         except Exception as e:
             print(f"Error updating time display: {e}")
-            
-        # Schedule the next update (every second)
-        self.root.after(1000, self.update_time_display)
 
     def toggle_reminders(self):
         if not self.is_running:
@@ -497,38 +547,36 @@ class ClockReminderApp:
                 self.validate_time_format(self.clock_in_time.get())
                 self.validate_time_format(self.clock_out_time.get())
                 self.start_reminders()
-                
-                # Update button appearance
-                self.start_button.config(text="Stop Reminders")
-                
-                # Update status
-                self.status_label.config(text="Reminders are active", fg=self.colors["primary"])
+                self._set_status("Stop Reminders", "Reminders are active", self.colors["primary"])
             except ValueError as e:
                 messagebox.showerror("Invalid Time Format", str(e))
         else:
             self.stop_reminders()
-            
-            # Update button appearance
-            self.start_button.config(text="Start Reminders")
-            
-            # Update status
-            self.status_label.config(text="Reminders stopped", fg=self.colors["text"])
+            self._set_status("Start Reminders", "Reminders stopped", self.colors["text"])
+
+    def _set_status(self, button_text, status_text, fg=None):
+        """Update the start/stop button and status line together"""
+        self.start_button.configure(text=button_text)
+        if fg is None:
+            self.status_label.configure(text=status_text)
+        else:
+            self.status_label.configure(text=status_text, fg=fg)
 
     def validate_time_format(self, time_str):
         """Validate the time format based on current settings"""
-        try:
-            if self.time_format.get() == '24-hour':
+        time_format = self.time_format.get()
+        match = _TIME_RE.fullmatch(time_str.strip())
+        if match:
+            hours, minutes = int(match.group(1)), int(match.group(2))
+            if time_format == '24-hour':
                 # 24-hour format validation
-                hours, minutes = map(int, time_str.split(':'))
-                if not (0 <= hours < 24 and 0 <= minutes < 60):
-                    raise ValueError
+                if 0 <= hours < 24 and minutes < 60:
+                    return
             else:
                 # 12-hour format validation
-                hours, minutes = map(int, time_str.split(':'))
-                if not (1 <= hours <= 12 and 0 <= minutes < 60):
-                    raise ValueError
-        except:
-            raise ValueError(f"Please enter a valid time in {self.time_format.get()} format")
+                if 1 <= hours <= 12 and minutes < 60:
+                    return
+        raise ValueError(f"Please enter a valid time in {time_format} format")
 
     def get_24h_time(self, time_str, am_pm=None):
         """Convert time to 24-hour format for internal processing"""
@@ -553,69 +601,131 @@ class ClockReminderApp:
             return f"{hours:02d}:{minutes:02d}"
 
     def start_reminders(self):
-        self.is_running = True
+        if not self.is_running:
+            self.is_running = True
+            self._dirty = True
         self.save_data()
         
-        # Create and start reminder thread
-        self.reminder_thread = threading.Thread(target=self.reminder_loop, daemon=True)
-        self.reminder_thread.start()
+        # Arm a single timer for the next reminder instead of polling every minute
+        self._schedule_next()
 
     def stop_reminders(self):
-        self.is_running = False
+        if self.is_running:
+            self.is_running = False
+            self._dirty = True
+        if self._reminder_after_id is not None:
+            self.root.after_cancel(self._reminder_after_id)
+            self._reminder_after_id = None
         self.save_data()
 
-    def reminder_loop(self):
-        last_date = None
+    def _tz(self):
+        """Return the tzinfo for the selected timezone, or None for local time"""
+        name = self.timezone.get()
+        if name == 'Local' or not HAVE_PYTZ:
+            return None
+        tz = self._tz_cache.get(name)
+        if tz is None:
+            try:
+                import pytz
+                tz = self._tz_cache[name] = pytz.timezone(name)
+            except Exception:
+                # Fallback to local time if timezone is invalid
+                return None
+        return tz
+
+    def _now(self):
+        """Current time in the selected timezone"""
+        tz = self._tz()
+        return datetime.datetime.now(tz) if tz else datetime.datetime.now()
+
+    def _recompute_targets(self, *args):
+        """Convert the clock in/out inputs to 24h "HH:MM" once per change"""
+        try:
+            self._clock_in_24h = self.get_24h_time(self.clock_in_time.get(), 'clock_in')
+            self._clock_out_24h = self.get_24h_time(self.clock_out_time.get(), 'clock_out')
+        except ValueError:
+            # Half-typed input; drop the stale timer and wait until it parses
+            self._clock_in_24h = self._clock_out_24h = None
+            self._targets = ()
+            if self._reminder_after_id is not None:
+                self.root.after_cancel(self._reminder_after_id)
+                self._reminder_after_id = None
+            return
         
-        while self.is_running:
-            # Get current time in the selected timezone
-            if self.timezone.get() == 'Local' or not pytz:
-                now = datetime.datetime.now()
-            else:
-                try:
-                    tz = pytz.timezone(self.timezone.get())
-                    now = datetime.datetime.now(tz)
-                except:
-                    # Fallback to local time if timezone is invalid
-                    now = datetime.datetime.now()
-            
-            current_time = now.strftime("%H:%M")  # Always use 24h format for comparison
-            current_date = now.strftime("%Y-%m-%d")
-            
-            # Convert input times to 24h format for comparison
-            clock_in_24h = self.get_24h_time(self.clock_in_time.get(), 'clock_in')
-            clock_out_24h = self.get_24h_time(self.clock_out_time.get(), 'clock_out')
-            
-            # Check if we need to send clock-in reminder
-            if current_time == clock_in_24h:
-                self.show_notification(
-                    "Clock In Reminder",
-                    f"It's time to clock in! ({current_time})"
-                )
-                
-                # If this is a new day, increment counter
-                if last_date != current_date:
-                    last_date = current_date
-                    self.reminder_count += 1
-                    # Use after() to safely update UI from another thread
-                    self.root.after(0, self.update_counter)
-            
-            # Check if we need to send clock-out reminder
-            if current_time == clock_out_24h:
-                self.show_notification(
-                    "Clock Out Reminder",
-                    f"It's time to clock out! ({current_time})"
-                )
-            
-            # Save data periodically
-            self.save_data()
+        # Zero-pad to "HH:MM" so _fire_reminder's comparison also matches input like "9:00",
+        # and keep (hour, minute) pairs for _schedule_next, skipping any entry that doesn't parse
+        normalized = []
+        targets = []
+        for hhmm in (self._clock_in_24h, self._clock_out_24h):
+            try:
+                hours, minutes = map(int, hhmm.split(':'))
+            except ValueError:
+                normalized.append(None)
+                continue
+            normalized.append(f"{hours:02d}:{minutes:02d}")
+            targets.append((hours, minutes))
+        self._clock_in_24h, self._clock_out_24h = normalized
+        self._targets = tuple(targets)
+        
+        # Move the reminder timer to the new times (or re-arm it if it had lapsed)
+        if self.is_running:
+            self._schedule_next()
+
+    def _schedule_next(self):
+        """Schedule _fire_reminder for the start of the next clock-in or clock-out minute"""
+        # Never leave two timers armed
+        if self._reminder_after_id is not None:
+            self.root.after_cancel(self._reminder_after_id)
+            self._reminder_after_id = None
+        now = self._now()
+        targets = []
+        for hours, minutes in self._targets:
+            try:
+                target = now.replace(hour=hours, minute=minutes, second=0, microsecond=0)
+            except ValueError:
+                continue
+            if target <= now:
+                target += datetime.timedelta(days=1)
+            targets.append(target)
+        if not targets:
+            return
+        delay_ms = int((min(targets) - now).total_seconds() * 1000)
+        self._reminder_after_id = self.root.after(delay_ms, self._fire_reminder)
+
+    def _fire_reminder(self):
+        """Send the reminders due this minute, then schedule the next one"""
+        self._reminder_after_id = None
+        now = self._now()
+        current_time = f"{now.hour:02d}:{now.minute:02d}"  # Always use 24h format for comparison
+        current_date = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        
+        # Check if we need to send clock-in reminder
+        if current_time == self._clock_in_24h:
+            self.show_notification(
+                "Clock In Reminder",
+                f"It's time to clock in! ({current_time})"
+            )
             
-            # Check every minute
-            time.sleep(60 - datetime.datetime.now().second)
+            # If this is a new day, increment counter
+            if self._last_reminder_date != current_date:
+                self._last_reminder_date = current_date
+                self.reminder_count += 1
+                self.update_counter()
+        
+        # Check if we need to send clock-out reminder
+        if current_time == self._clock_out_24h:
+            self.show_notification(
+                "Clock Out Reminder",
+                f"It's time to clock out! ({current_time})"
+            )
+        
+        if self.is_running:
+            self._schedule_next()
 
     def update_counter(self):
         """Update counter with animation"""
         self.animate_counter(self.reminder_count)
+        self._dirty = True
         self.save_data()
 
     def show_notification(self, title, message):
@@ -661,25 +771,29 @@ class ClockReminderApp:
             messagebox.showerror("Error", f"Could not send notification: {str(e)}")
 
     def save_data(self):
-        """Save application data to JSON file"""
+        """Save application data to JSON file if anything changed since the last save"""
+        if not self._dirty:
+            return
+        # Each Tk variable read is a Tcl round-trip, so read the format once
+        time_format = self.time_format.get()
         data = {
             "clock_in_time": self.clock_in_time.get(),
             "clock_out_time": self.clock_out_time.get(),
             "reminder_count": self.reminder_count,
             "is_running": self.is_running,
-            "time_format": self.time_format.get(),
+            "time_format": time_format,
             "timezone": self.timezone.get()
         }
         
         # Save AM/PM settings if in 12-hour mode
-        if self.time_format.get() == '12-hour' and hasattr(self, 'clock_in_ampm'):
+        if time_format == '12-hour' and self.clock_in_ampm is not None:
             data["clock_in_ampm"] = self.clock_in_ampm.get()
             data["clock_out_ampm"] = self.clock_out_ampm.get()
         
         try:
             data_file = self.data_dir / "clock_reminder_data.json"
-            with open(data_file, "w") as f:
-                json.dump(data, f)
+            write_json_atomic(data_file, data)
+            self._dirty = False
         except Exception as e:
             print(f"Error saving data: {str(e)}")
 
@@ -687,41 +801,43 @@ class ClockReminderApp:
         """Load application data from JSON file"""
         try:
             data_file = self.data_dir / "clock_reminder_data.json"
-            if data_file.exists():
-                with open(data_file, "r") as f:
-                    data = json.load(f)
-                    self.clock_in_time.set(data.get("clock_in_time", "09:00"))
-                    self.clock_out_time.set(data.get("clock_out_time", "17:00"))
-                    self.reminder_count = data.get("reminder_count", 0)
-                    self.is_running = data.get("is_running", False)
-                    
-                    # Load time format and timezone settings if available
-                    if "time_format" in data:
-                        self.time_format.set(data["time_format"])
-                    if "timezone" in data:
-                        self.timezone.set(data["timezone"])
-                        
-                    # Store AM/PM settings to be applied after widgets are created
-                    self.saved_clock_in_ampm = data.get("clock_in_ampm", "AM")
-                    self.saved_clock_out_ampm = data.get("clock_out_ampm", "PM")
+            # Just open it; a missing file is the first-run case, not an error
+            with open(data_file, "rb") as f:
+                data = {**_DEFAULTS, **_json_loads(f.read())}
+            self.clock_in_time.set(data["clock_in_time"])
+            self.clock_out_time.set(data["clock_out_time"])
+            self.reminder_count = data["reminder_count"]
+            self.is_running = data["is_running"]
+            
+            # Load time format and timezone settings
+            self.time_format.set(data["time_format"])
+            self.timezone.set(data["timezone"])
+                
+            # Store AM/PM settings to be applied after widgets are created
+            self.saved_clock_in_ampm = data["clock_in_ampm"]
+            self.saved_clock_out_ampm = data["clock_out_ampm"]
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading data: {str(e)}")
             
     def load_presets(self):
         """Load saved presets from file"""
+        preset_file = self.data_dir / "clock_reminder_presets.json"
         try:
-            preset_file = self.data_dir / "clock_reminder_presets.json"
-            if preset_file.exists():
-                with open(preset_file, "r") as f:
-                    return json.load(f)
-        except:
-            pass
+            with open(preset_file, "rb") as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            pass  # No presets saved yet
+        except (OSError, ValueError) as e:
+            # Unreadable file or bad JSON (both json and orjson decode errors are ValueErrors)
+            print(f"Error loading presets: {str(e)}")
         
         return {}  # Return empty dict if no presets or error
 
     def update_preset_list(self):
         """Update the presets dropdown with available presets"""
-        presets = self.load_presets()
+        presets = self._presets
         
         # Update dropdown values
         self.preset_dropdown['values'] = list(presets.keys())
@@ -736,66 +852,94 @@ class ClockReminderApp:
         if not preset_name:
             return
         
-        # Load presets
-        presets = self.load_presets()
+        presets = self._presets
         
         # Check if selected preset exists
         if preset_name in presets:
             preset_data = presets[preset_name]
+            wanted = (
+                preset_data.get("clock_in_time", _DEFAULTS["clock_in_time"]),
+                preset_data.get("clock_out_time", _DEFAULTS["clock_out_time"]),
+                preset_data.get("time_format", _DEFAULTS["time_format"]),
+                preset_data.get("clock_in_ampm"),
+                preset_data.get("clock_out_ampm"),
+            )
+            current = (
+                self.clock_in_time.get(),
+                self.clock_out_time.get(),
+                self.time_format.get(),
+                wanted[3] and self.clock_in_ampm.get(),
+                wanted[4] and self.clock_out_ampm.get(),
+            )
             
-            # Apply preset settings
-            self.clock_in_time.set(preset_data.get("clock_in_time", "09:00"))
-            self.clock_out_time.set(preset_data.get("clock_out_time", "17:00"))
-            
-            # Apply time format if different
-            if preset_data.get("time_format") != self.time_format.get():
-                self.time_format.set(preset_data.get("time_format", "24-hour"))
-                self.update_time_format()
-            
-            # Apply AM/PM settings if in 12-hour mode
-            if self.time_format.get() == '12-hour' and hasattr(self, 'clock_in_ampm'):
-                if "clock_in_ampm" in preset_data:
-                    self.clock_in_ampm.set(preset_data["clock_in_ampm"])
-                if "clock_out_ampm" in preset_data:
-                    self.clock_out_ampm.set(preset_data["clock_out_ampm"])
+            # Skip all the variable writes and relayout if the preset is already applied
+            if wanted != current:
+                # Apply preset settings
+                self.clock_in_time.set(wanted[0])
+                self.clock_out_time.set(wanted[1])
+                
+                # Apply time format if different
+                time_format = wanted[2]
+                if time_format != current[2]:
+                    self.time_format.set(time_format)
+                    self.update_time_format()
+                
+                # Apply AM/PM settings if in 12-hour mode
+                if time_format == '12-hour' and self.clock_in_ampm is not None:
+                    if "clock_in_ampm" in preset_data:
+                        self.clock_in_ampm.set(preset_data["clock_in_ampm"])
+                    if "clock_out_ampm" in preset_data:
+                        self.clock_out_ampm.set(preset_data["clock_out_ampm"])
+                    self._recompute_targets()
             
             messagebox.showinfo("Success", f"Loaded preset '{preset_name}'")
             
     def update_time_format(self, event=None):
         """Handle changes in the time format selection."""
-        selected_format = self.time_format.get()
+        is_12h = self.time_format.get() == '12-hour'
+        # The AM/PM selectors are built once; only repack them when the format actually flips
+        if is_12h == self._is_12h:
+            return
+        self._is_12h = is_12h
 
         # Update the hint label
-        if selected_format == '24-hour':
-            self.format_hint.config(text="Format: HH:MM (24-hour)")
-            # Hide AM/PM selectors if they exist and are packed
-            if hasattr(self, 'clock_in_ampm') and self.clock_in_ampm.winfo_ismapped():
-                self.clock_in_ampm.pack_forget()
-            if hasattr(self, 'clock_out_ampm') and self.clock_out_ampm.winfo_ismapped():
-                self.clock_out_ampm.pack_forget()
+        if not is_12h:
+            self.format_hint.config(text=self._HINT_24H)
+            # Hide AM/PM selectors
+            self.clock_in_ampm.pack_forget()
+            self.clock_out_ampm.pack_forget()
         else: # 12-hour format
-            self.format_hint.config(text="Format: HH:MM (12-hour)")
-            # Show AM/PM selectors if they exist and are not already packed
-            # Ensure they are placed correctly relative to the entry widget
-            if hasattr(self, 'clock_in_ampm') and not self.clock_in_ampm.winfo_ismapped():
-                self.clock_in_ampm.pack(side=tk.LEFT, padx=5, after=self.clock_in_entry)
-            if hasattr(self, 'clock_out_ampm') and not self.clock_out_ampm.winfo_ismapped():
-                self.clock_out_ampm.pack(side=tk.LEFT, padx=5, after=self.clock_out_entry)
+            self.format_hint.config(text=self._HINT_12H)
+            # Show AM/PM selectors, placed right after their entry widgets
+            self.clock_in_ampm.pack(side=tk.LEFT, padx=5, after=self.clock_in_entry)
+            self.clock_out_ampm.pack(side=tk.LEFT, padx=5, after=self.clock_out_entry)
         self.save_data() # Save the new format setting
         
     def start_animations(self):
         """Start the UI animations."""
         self.animation_active = True
-        # Start dinosaur animation loop
-        self.animate_dinosaur()
+        # Start the shared UI tick (dinosaur + clock)
+        self._ui_tick()
         # Initialize counter display (animation happens on update)
         self.update_counter_display(self.reminder_count) # Initial display
 
-    def animate_dinosaur(self):
-        """Animates the dinosaur walking back and forth."""
+    def _ui_tick(self):
+        """Advance the dinosaur every 100ms and refresh the clock when the second changes."""
         if not self.animation_active:
             return # Stop animation if not active
 
+        if self._visible:
+            self.animate_dinosaur()
+            now_second = int(time.time())
+            if now_second != self._last_second:
+                self._last_second = now_second
+                self.update_time_display()
+
+        # Schedule the next frame (adjust timing for speed, e.g., 100ms)
+        self.root.after(100, self._ui_tick)
+
+    def animate_dinosaur(self):
+        """Animates the dinosaur walking back and forth."""
         # Update position based on direction
         self.dino_position += self.dino_direction
 
@@ -808,36 +952,45 @@ class ClockReminderApp:
         # Redraw the dinosaur
         self.draw_dinosaur()
 
-        # Schedule the next frame (adjust timing for speed, e.g., 100ms)
-        self.root.after(100, self.animate_dinosaur)
-
     def animate_counter(self, target_value):
         """Animates the counter value increasing."""
-        # Get current displayed value (handle potential errors)
-        try:
-            current_value_str = self.counter_canvas.itemcget(self.count_display, 'text')
-            current_value = int(current_value_str)
-        except:
-             current_value = 0 # Default if text is not an int
+        # Start from the value currently on screen
+        current_value = self._counter_shown
 
-        # Calculate step (can be adjusted for smoother/faster animation)
-        step = math.ceil((target_value - current_value) / 10) # Move 1/10th of the way
-        if step == 0 and target_value > current_value:
-             step = 1 # Ensure at least 1 step increment if not yet at target
+        # Compute every displayed value up front, moving 1/10th of the way each step
+        frames = []
+        while True:
+            step = math.ceil((target_value - current_value) / 10)
+            if step == 0 and target_value > current_value:
+                 step = 1 # Ensure at least 1 step increment if not yet at target
+            current_value += step
+            if current_value >= target_value:
+                # Reached or passed target, end on the final value
+                frames.append(target_value)
+                break
+            frames.append(current_value)
 
-        next_value = current_value + step
+        # Replace any animation that is still running
+        if self._counter_after_id is not None:
+            self.root.after_cancel(self._counter_after_id)
+        self._counter_frames = frames
+        self._step_counter(0)
 
-        if next_value >= target_value:
-            # Reached or passed target, set final value
-            self.update_counter_display(target_value)
+    def _step_counter(self, index):
+        """Show one precomputed counter frame and schedule the next (50ms apart)."""
+        self.update_counter_display(self._counter_frames[index])
+        if index + 1 < len(self._counter_frames):
+            self._counter_after_id = self.root.after(50, self._step_counter, index + 1)
         else:
-            # Update display and schedule next step
-            self.update_counter_display(next_value)
-            self.root.after(50, lambda: self.animate_counter(target_value)) # Adjust speed (50ms)
+            self._counter_after_id = None
 
     def update_counter_display(self, value):
          """Helper function to update the counter canvas text."""
-         self.counter_canvas.itemconfig(self.count_display, text=str(value))
+         # Only retext the existing item; skip the call if the value is already shown
+         if value != self._counter_shown:
+             self._counter_shown = value
+             self.counter_canvas.itemconfigure(self.count_display, text=str(value))
+
     def show_notification(self, title, message):
         """Use multiple methods to ensure notification is shown"""
         # Print to console for confirmation